@@ -32,6 +32,7 @@ from .codex_runner import (
 )
 from .utils import (
     read_json,
+    read_json_cached,
     write_json,
     ensure_dir,
     get_timestamp,
@@ -72,6 +73,7 @@ __all__ = [
 
     # Utilities
     'read_json',
+    'read_json_cached',
     'write_json',
     'ensure_dir',
     'get_timestamp',
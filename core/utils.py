@@ -9,6 +9,7 @@ This module provides common utilities used throughout the project including:
 - Path validation
 """
 
+import functools
 import json
 import os
 from datetime import datetime
@@ -16,6 +17,11 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def read_json(file_path: str) -> Dict[str, Any]:
     """
@@ -40,6 +46,45 @@ def read_json(file_path: str) -> Dict[str, Any]:
         return json.load(f)
 
 
+@functools.lru_cache(maxsize=128)
+def _read_json_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a JSON file; cached per (path, mtime, size) by read_json_cached."""
+    data = Path(file_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json_cached(file_path: str) -> Dict[str, Any]:
+    """
+    Read and parse a JSON file, reusing the parsed result while it is unchanged.
+
+    The cache is keyed by path, modification time and size, so rewriting the
+    file invalidates the entry. Uses orjson for parsing when it is installed.
+
+    The returned object is shared between callers and must be treated as
+    read-only; use read_json() when the data will be modified.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data as dictionary
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file contains invalid JSON
+    """
+    file_path = Path(file_path)
+
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"JSON file not found: {file_path}") from None
+
+    return _read_json_cached(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
 def write_json(file_path: str, data: Dict[str, Any], indent: int = 2) -> None:
     """
     Write data to a JSON file with pretty formatting.
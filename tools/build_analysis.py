@@ -27,6 +27,7 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -180,8 +181,16 @@ def build_analysis(mp3_path: str, lyrics_path: str, output_path: str,
         return False
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code (0 on success)
+    """
     parser = argparse.ArgumentParser(
         description="Generate analysis.json from MP3 + lyrics for MV Orchestra v2.8",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -239,7 +248,7 @@ Note:
         help="Enable verbose logging"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set logging level
     if args.verbose:
@@ -254,8 +263,8 @@ Note:
         artist=args.artist
     )
 
-    sys.exit(0 if success else 1)
+    return 0 if success else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
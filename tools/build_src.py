@@ -26,7 +26,7 @@ import sys
 import json
 import tempfile
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -376,8 +376,16 @@ def build_src(mp3_path: str, lyrics_path: str, output_path: str,
         return False
 
 
-def main():
-    """Main entry point."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code (0 on success)
+    """
     parser = argparse.ArgumentParser(
         description="Generate SRC (lyrics timecode) from MP3 + lyrics for MV Orchestra v2.8",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -445,7 +453,7 @@ Note:
         help="Enable verbose logging"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Set logging level
     if args.verbose:
@@ -460,8 +468,8 @@ Note:
         whisper_model=args.whisper_model
     )
 
-    sys.exit(0 if success else 1)
+    return 0 if success else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
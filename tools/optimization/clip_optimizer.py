@@ -27,7 +27,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
 from core import SharedState
-from core.utils import read_json, write_json, get_iso_timestamp
+from core.utils import read_json_cached, write_json, get_iso_timestamp
+from .emotion_target_builder import load_emotion_curve
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -91,7 +92,7 @@ class ClipOptimizer:
                 "Run emotion_target_builder first."
             )
 
-        curve_data = read_json(curve_path)
+        curve_data = load_emotion_curve(curve_path)
         emotion_curve = curve_data.get('curve', [])
         logger.info(f"Loaded emotion curve with {len(emotion_curve)} samples")
 
@@ -116,10 +117,10 @@ class ClipOptimizer:
             from core.utils import get_project_root
             analysis_path = get_project_root() / "shared-workspace" / "input" / "analysis.json"
             if analysis_path.exists():
-                analysis = read_json(str(analysis_path))
+                analysis = read_json_cached(str(analysis_path))
                 # Check if beat times are directly available
                 if 'beats' in analysis:
-                    return analysis['beats']
+                    return list(analysis['beats'])
                 # Otherwise estimate from BPM
                 bpm = analysis.get('bpm', 120)
                 duration = analysis.get('duration', 180)
@@ -17,6 +17,7 @@ Usage:
 import argparse
 import json
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -25,13 +26,55 @@ from core.utils import read_json, write_json, get_iso_timestamp
 from .emotion_utils import (
     get_section_emotion_value,
     interpolate_smooth,
-    get_emotion_statistics
+    get_value_statistics,
+    pack_emotion_curve,
+    unpack_emotion_curve
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds before a section boundary over which emotions are blended
+TRANSITION_DURATION = 2.0
+
+
+@dataclass
+class SectionArrays:
+    """
+    Column-oriented view of section metadata.
+
+    The curve builder reads the same few fields of every section for each
+    sample, so they are kept in parallel sequences instead of per-section
+    dicts. The dict list is still used for the JSON export.
+
+    Attributes:
+        names: Section names
+        starts: Section start times in seconds
+        ends: Section end times in seconds
+        targets: Target emotion values
+        labels: Emotion labels
+    """
+    names: List[str]
+    starts: List[float]
+    ends: List[float]
+    targets: List[float]
+    labels: List[str]
+
+    @classmethod
+    def from_metadata(cls, section_metadata: List[Dict]) -> 'SectionArrays':
+        """Build arrays from a list of section metadata dicts."""
+        return cls(
+            names=[s['section_name'] for s in section_metadata],
+            starts=[s['start_time'] for s in section_metadata],
+            ends=[s['end_time'] for s in section_metadata],
+            targets=[s['target_emotion'] for s in section_metadata],
+            labels=[s['emotion_label'] for s in section_metadata]
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
 
 class EmotionTargetBuilder:
     """
@@ -53,6 +96,7 @@ class EmotionTargetBuilder:
         self.session_id = session_id
         self.sampling_rate = sampling_rate
         self.session = SharedState.load_session(session_id)
+        self.total_duration = 0.0
 
     def load_phase2_data(self) -> Dict[str, Any]:
         """
@@ -111,6 +155,8 @@ class EmotionTargetBuilder:
         # Sort by start time
         section_metadata.sort(key=lambda s: s['start_time'])
 
+        self.total_duration = max((s['end_time'] for s in section_metadata), default=0.0)
+
         return section_metadata
 
     def build_emotion_curve(self, section_metadata: List[Dict],
@@ -125,119 +171,118 @@ class EmotionTargetBuilder:
         Returns:
             List of curve points with time and emotion values
         """
-        curve = []
+        return unpack_emotion_curve(
+            self.build_curve_columns(section_metadata, total_duration)
+        )
+
+    def build_curve_columns(self, section_metadata: List[Dict],
+                            total_duration: float) -> Dict[str, List]:
+        """
+        Build the emotion curve directly in column-oriented form.
+
+        Same samples as build_emotion_curve, laid out as produced by
+        pack_emotion_curve, without allocating a dict per sample.
+
+        Args:
+            section_metadata: List of sections with emotion values
+            total_duration: Total duration of the song in seconds
+
+        Returns:
+            Dictionary of curve columns plus string lookup tables
+        """
+        sections = SectionArrays.from_metadata(section_metadata)
+
+        # Transition zone is the last TRANSITION_DURATION seconds of each
+        # section; it only depends on the sections, so compute it once
+        transition_starts = [
+            max(start, end - TRANSITION_DURATION)
+            for start, end in zip(sections.starts, sections.ends)
+        ]
+
+        times = []
+        emotions = []
+        source_ids = []
+        label_ids = []
+        section_names: Dict[str, int] = {}
+        labels: Dict[str, int] = {}
         current_time = 0.0
 
         # Generate samples at regular intervals
         while current_time <= total_duration:
             # Find which section this time belongs to
-            current_section = self._find_section_at_time(
-                current_time, section_metadata
-            )
+            idx = self._find_section_at_time(current_time, sections)
 
-            if current_section is None:
+            if idx is None:
                 # Before first section or after last section
-                if current_time < section_metadata[0]['start_time']:
+                if current_time < sections.starts[0]:
                     # Use first section's emotion
-                    emotion = section_metadata[0]['target_emotion']
-                    label = section_metadata[0]['emotion_label']
-                    section_name = section_metadata[0]['section_name']
+                    idx = 0
                 else:
                     # Use last section's emotion
-                    emotion = section_metadata[-1]['target_emotion']
-                    label = section_metadata[-1]['emotion_label']
-                    section_name = section_metadata[-1]['section_name']
+                    idx = len(sections) - 1
+                emotion = sections.targets[idx]
+                label = sections.labels[idx]
             else:
                 # Within a section
-                section_name = current_section['section_name']
-                label = current_section['emotion_label']
+                label = sections.labels[idx]
+                emotion = sections.targets[idx]
 
                 # Check if we're near a transition to next section
-                next_section = self._find_next_section(
-                    current_section, section_metadata
-                )
-
-                if next_section and self._is_in_transition_zone(
-                    current_time, current_section, next_section
-                ):
+                next_idx = idx + 1
+                if (next_idx < len(sections) and
+                        transition_starts[idx] <= current_time < sections.ends[idx]):
                     # Interpolate between current and next section
                     emotion = self._interpolate_between_sections(
-                        current_time, current_section, next_section
+                        current_time, sections, idx, next_idx
                     )
-                    label = f"{current_section['emotion_label']}→{next_section['emotion_label']}"
-                else:
-                    # Use current section's emotion
-                    emotion = current_section['target_emotion']
+                    label = f"{sections.labels[idx]}→{sections.labels[next_idx]}"
 
             # Add curve point
-            curve.append({
-                'time': round(current_time, 2),
-                'emotion': round(emotion, 3),
-                'source_section': section_name,
-                'label': label
-            })
+            times.append(round(current_time, 2))
+            emotions.append(round(emotion, 3))
+            source_ids.append(
+                section_names.setdefault(sections.names[idx], len(section_names))
+            )
+            label_ids.append(labels.setdefault(label, len(labels)))
 
             current_time += self.sampling_rate
 
-        logger.info(f"Built emotion curve with {len(curve)} samples")
-        return curve
+        logger.info(f"Built emotion curve with {len(times)} samples")
+        return {
+            'time': times,
+            'emotion': emotions,
+            'source_section': source_ids,
+            'label': label_ids,
+            'section_names': list(section_names),
+            'labels': list(labels)
+        }
 
     def _find_section_at_time(self, time: float,
-                              sections: List[Dict]) -> Dict | None:
-        """Find the section that contains the given time."""
-        for section in sections:
-            if section['start_time'] <= time < section['end_time']:
-                return section
-        return None
-
-    def _find_next_section(self, current_section: Dict,
-                          sections: List[Dict]) -> Dict | None:
-        """Find the section that comes after the current one."""
-        current_idx = sections.index(current_section)
-        if current_idx < len(sections) - 1:
-            return sections[current_idx + 1]
+                              sections: SectionArrays) -> int | None:
+        """Find the index of the section that contains the given time."""
+        for idx, (start, end) in enumerate(zip(sections.starts, sections.ends)):
+            if start <= time < end:
+                return idx
         return None
 
-    def _is_in_transition_zone(self, time: float,
-                               current_section: Dict,
-                               next_section: Dict,
-                               transition_duration: float = 2.0) -> bool:
-        """
-        Check if time is in transition zone between sections.
-
-        Args:
-            time: Current time
-            current_section: Current section
-            next_section: Next section
-            transition_duration: Duration of transition zone in seconds
-
-        Returns:
-            True if in transition zone
-        """
-        # Transition zone is the last N seconds of current section
-        section_end = current_section['end_time']
-        transition_start = max(
-            current_section['start_time'],
-            section_end - transition_duration
-        )
-
-        return transition_start <= time < section_end
-
     def _interpolate_between_sections(self, time: float,
-                                      current_section: Dict,
-                                      next_section: Dict) -> float:
+                                      sections: SectionArrays,
+                                      current_idx: int,
+                                      next_idx: int) -> float:
         """Smoothly interpolate emotion between two sections."""
+        section_end = sections.ends[current_idx]
         return interpolate_smooth(
-            current_section['target_emotion'],
-            next_section['target_emotion'],
-            current_section['end_time'] - 2.0,  # Start interpolating 2s before section end
-            current_section['end_time'],
+            sections.targets[current_idx],
+            sections.targets[next_idx],
+            section_end - TRANSITION_DURATION,  # Start interpolating before section end
+            section_end,
             time
         )
 
     def save_emotion_curve(self, curve: List[Dict],
                           section_metadata: List[Dict],
-                          total_duration: float) -> Path:
+                          total_duration: float,
+                          curve_columns: Dict[str, List] | None = None) -> Path:
         """
         Save emotion curve to session directory.
 
@@ -245,12 +290,16 @@ class EmotionTargetBuilder:
             curve: Emotion curve data
             section_metadata: Section metadata
             total_duration: Total duration
+            curve_columns: Column-oriented form of the curve, if already built
 
         Returns:
             Path to saved file
         """
+        if curve_columns is None:
+            curve_columns = pack_emotion_curve(curve)
+
         # Calculate statistics
-        statistics = get_emotion_statistics(curve)
+        statistics = get_value_statistics(curve_columns['emotion'])
 
         # Prepare output data
         output_data = {
@@ -261,7 +310,7 @@ class EmotionTargetBuilder:
                 'sampling_rate': self.sampling_rate,
                 'total_duration': total_duration
             },
-            'curve': curve,
+            'curve_columns': curve_columns,
             'sections': section_metadata,
             'statistics': statistics
         }
@@ -270,7 +319,8 @@ class EmotionTargetBuilder:
         session_dir = self.session.session_dir
         output_path = session_dir / "target_emotion_curve.json"
 
-        write_json(str(output_path), output_data)
+        # Compact output: the curve columns dominate the file size
+        write_json(str(output_path), output_data, indent=None)
         logger.info(f"Saved emotion curve to {output_path}")
 
         return output_path
@@ -315,22 +365,23 @@ class EmotionTargetBuilder:
             phase2_proposal = self.load_phase2_data()
             sections = phase2_proposal.get('sections', [])
 
-            # Calculate total duration from sections
-            total_duration = max(s.get('end_time', 0.0) for s in sections)
-
             # Build section metadata with emotion values
             section_metadata = self.build_section_metadata(sections)
 
+            # Total duration is cached while building the metadata
+            total_duration = self.total_duration
+
             # Build emotion curve
-            curve = self.build_emotion_curve(section_metadata, total_duration)
+            curve_columns = self.build_curve_columns(section_metadata, total_duration)
+            curve = unpack_emotion_curve(curve_columns)
 
             # Save curve
             curve_path = self.save_emotion_curve(
-                curve, section_metadata, total_duration
+                curve, section_metadata, total_duration, curve_columns
             )
 
             # Calculate statistics
-            statistics = get_emotion_statistics(curve)
+            statistics = get_value_statistics(curve_columns['emotion'])
 
             # Update session metadata
             self.update_session_metadata(curve_path, statistics)
@@ -364,6 +415,25 @@ def build_target_curve(session_id: str, sampling_rate: float = 0.5) -> Dict[str,
     return builder.run()
 
 
+def load_emotion_curve(file_path: str) -> Dict[str, Any]:
+    """
+    Load a saved emotion curve file.
+
+    Files written in the column-oriented layout get their 'curve' list of
+    point dicts rebuilt, so callers can use either file format.
+
+    Args:
+        file_path: Path to target_emotion_curve.json
+
+    Returns:
+        Curve file data including a 'curve' list of points
+    """
+    curve_data = read_json(file_path)
+    if 'curve' not in curve_data and 'curve_columns' in curve_data:
+        curve_data['curve'] = unpack_emotion_curve(curve_data['curve_columns'])
+    return curve_data
+
+
 def main():
     """CLI entry point."""
     parser = argparse.ArgumentParser(
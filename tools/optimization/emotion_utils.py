@@ -5,6 +5,7 @@ Shared utilities for mapping emotional descriptions to numeric values
 and interpolating emotion curves across timeline sections.
 """
 
+from operator import itemgetter
 from typing import Dict, List, Tuple, Optional
 import re
 
@@ -71,6 +72,17 @@ EMOTION_MAP = {
     "tension": 0.7,
 }
 
+# Single-pass keyword scanner over EMOTION_MAP. The lookahead yields the
+# longest keyword starting at every position (including overlapping ones),
+# so the longest-match preference below matches the old per-keyword scan.
+_KEYWORD_ORDER = {keyword: i for i, keyword in enumerate(EMOTION_MAP)}
+_EMOTION_RE = re.compile(
+    "(?=(" + "|".join(
+        re.escape(keyword)
+        for keyword in sorted(EMOTION_MAP, key=len, reverse=True)
+    ) + "))"
+)
+
 
 def map_emotion_to_value(emotion_text: str, default: float = 0.5) -> Tuple[float, str]:
     """
@@ -96,18 +108,14 @@ def map_emotion_to_value(emotion_text: str, default: float = 0.5) -> Tuple[float
         return EMOTION_MAP[text_lower], text_lower
 
     # Try to find keywords in the text
-    best_match = None
-    best_keyword = None
-
-    for keyword, value in EMOTION_MAP.items():
-        if keyword in text_lower:
-            # Prefer longer matches (more specific)
-            if best_match is None or len(keyword) > len(best_keyword):
-                best_match = value
-                best_keyword = keyword
+    matches = {m.group(1) for m in _EMOTION_RE.finditer(text_lower)}
 
-    if best_match is not None:
-        return best_match, best_keyword
+    if matches:
+        # Prefer longer matches (more specific), then map order
+        best_keyword = min(
+            matches, key=lambda k: (-len(k), _KEYWORD_ORDER[k])
+        )
+        return EMOTION_MAP[best_keyword], best_keyword
 
     # No match found, check for energy level descriptors
     if "high" in text_lower or "intense" in text_lower:
@@ -252,7 +260,22 @@ def get_emotion_statistics(curve: List[Dict]) -> Dict:
     Returns:
         Dictionary with min, max, avg, std_dev
     """
-    if not curve:
+    return get_value_statistics(list(map(itemgetter("emotion"), curve)))
+
+
+def get_value_statistics(emotions: List[float]) -> Dict:
+    """
+    Calculate statistics for a sequence of emotion values.
+
+    Used directly on the 'emotion' column of a column-oriented curve.
+
+    Args:
+        emotions: Emotion values
+
+    Returns:
+        Dictionary with min, max, avg, std_dev
+    """
+    if not emotions:
         return {
             "min_emotion": 0.0,
             "max_emotion": 0.0,
@@ -261,14 +284,15 @@ def get_emotion_statistics(curve: List[Dict]) -> Dict:
             "total_samples": 0
         }
 
-    emotions = [point["emotion"] for point in curve]
+    # min/max/sum iterate in C (no per-sample Python bytecode)
+    count = len(emotions)
 
     min_emotion = min(emotions)
     max_emotion = max(emotions)
-    avg_emotion = sum(emotions) / len(emotions)
+    avg_emotion = sum(emotions) / count
 
-    # Calculate standard deviation
-    variance = sum((e - avg_emotion) ** 2 for e in emotions) / len(emotions)
+    # Calculate standard deviation (two-pass: E[x^2] - mean^2 cancels badly)
+    variance = sum((e - avg_emotion) ** 2 for e in emotions) / count
     std_dev = variance ** 0.5
 
     return {
@@ -276,5 +300,64 @@ def get_emotion_statistics(curve: List[Dict]) -> Dict:
         "max_emotion": round(max_emotion, 3),
         "avg_emotion": round(avg_emotion, 3),
         "std_dev": round(std_dev, 3),
-        "total_samples": len(curve)
+        "total_samples": count
+    }
+
+
+def pack_emotion_curve(curve: List[Dict]) -> Dict[str, List]:
+    """
+    Convert curve points to a column-oriented layout for persistence.
+
+    Section names and labels repeat across many samples, so each distinct
+    string is stored once and samples refer to it by index.
+
+    Args:
+        curve: List of curve points with time, emotion, source_section, label
+
+    Returns:
+        Dictionary of parallel columns plus string lookup tables
+    """
+    section_names: Dict[str, int] = {}
+    labels: Dict[str, int] = {}
+
+    return {
+        "time": [point["time"] for point in curve],
+        "emotion": [point["emotion"] for point in curve],
+        "source_section": [
+            section_names.setdefault(point["source_section"], len(section_names))
+            for point in curve
+        ],
+        "label": [
+            labels.setdefault(point["label"], len(labels))
+            for point in curve
+        ],
+        "section_names": list(section_names),
+        "labels": list(labels)
     }
+
+
+def unpack_emotion_curve(columns: Dict[str, List]) -> List[Dict]:
+    """
+    Rebuild curve points from the layout produced by pack_emotion_curve.
+
+    Args:
+        columns: Column-oriented curve data
+
+    Returns:
+        List of curve points with time, emotion, source_section, label
+    """
+    section_names = columns["section_names"]
+    labels = columns["labels"]
+
+    return [
+        {
+            "time": time,
+            "emotion": emotion,
+            "source_section": section_names[section_idx],
+            "label": labels[label_idx]
+        }
+        for time, emotion, section_idx, label_idx in zip(
+            columns["time"], columns["emotion"],
+            columns["source_section"], columns["label"]
+        )
+    ]
@@ -9,10 +9,11 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from core import SharedState
-from core.utils import get_session_dir, read_json
+from core.utils import get_session_dir
 from tools.optimization.emotion_target_builder import (
     EmotionTargetBuilder,
-    build_target_curve
+    build_target_curve,
+    load_emotion_curve
 )
 from tools.optimization.clip_optimizer import (
     ClipOptimizer,
@@ -118,7 +119,7 @@ def test_emotion_target_builder(test_session_id):
     print("\n5. Testing saved file...")
     curve_path = Path(result['curve_path'])
     assert curve_path.exists()
-    curve_data = read_json(str(curve_path))
+    curve_data = load_emotion_curve(str(curve_path))
     assert 'metadata' in curve_data
     assert 'curve' in curve_data
     assert 'sections' in curve_data
@@ -5,6 +5,7 @@ Run with: python -m pytest tools/optimization/test_emotion_target_builder.py -v
 Or: python tools/optimization/test_emotion_target_builder.py
 """
 
+import copy
 import json
 from pathlib import Path
 import sys
@@ -18,24 +19,24 @@ except ImportError:
     pytest = None  # Allow running without pytest
 
 from core import SharedState
-from core.utils import get_session_dir, read_json
+from core.utils import get_session_dir
 from tools.optimization.emotion_target_builder import (
     EmotionTargetBuilder,
-    build_target_curve
+    build_target_curve,
+    load_emotion_curve
 )
 from tools.optimization.emotion_utils import (
     map_emotion_to_value,
-    get_emotion_statistics
+    get_emotion_statistics,
+    get_value_statistics,
+    unpack_emotion_curve
 )
 
 
 # Only define pytest-based tests if pytest is available
 if pytest is not None:
-    class TestEmotionTargetBuilder:
-        """Test suite for EmotionTargetBuilder."""
-
-    @pytest.fixture
-    def test_session_id(self):
+    @pytest.fixture(scope="session")
+    def test_session_id():
         """
         Get a test session ID that has Phase 0, 1, and 2 completed.
         This uses an existing test session from the test suite.
@@ -43,154 +44,173 @@ if pytest is not None:
         # Use the latest session that has Phase 2 completed
         return "mvorch_20251114_163545_d1c7c8d0"
 
-    def test_emotion_mapping(self):
-        """Test emotion keyword to value mapping."""
-        # Test exact matches
-        value, label = map_emotion_to_value("mysterious")
-        assert value == 0.4
-        assert label == "mysterious"
-
-        value, label = map_emotion_to_value("intense")
-        assert value == 1.0
-        assert label == "intense"
-
-        value, label = map_emotion_to_value("calm")
-        assert value == 0.2
-        assert label == "calm"
-
-    def test_emotion_mapping_composite(self):
-        """Test mapping of composite emotion descriptions."""
-        value, label = map_emotion_to_value("emotional, artistic intro")
-        assert 0.5 <= value <= 0.7  # Should match "emotional"
-
-        value, label = map_emotion_to_value("upbeat and energetic")
-        assert value == 0.8  # Should match "upbeat" or "energetic"
-
-    def test_builder_initialization(self, test_session_id):
-        """Test builder initialization."""
-        builder = EmotionTargetBuilder(test_session_id, sampling_rate=0.5)
-        assert builder.session_id == test_session_id
-        assert builder.sampling_rate == 0.5
-        assert builder.session is not None
-
-    def test_load_phase2_data(self, test_session_id):
-        """Test loading Phase 2 data."""
-        builder = EmotionTargetBuilder(test_session_id)
-        proposal = builder.load_phase2_data()
-
-        assert 'sections' in proposal
-        assert len(proposal['sections']) > 0
-
-    def test_build_section_metadata(self, test_session_id):
-        """Test building section metadata with emotion values."""
-        builder = EmotionTargetBuilder(test_session_id)
-        proposal = builder.load_phase2_data()
-        sections = proposal['sections']
-
-        metadata = builder.build_section_metadata(sections)
-
-        assert len(metadata) == len(sections)
-        for section in metadata:
-            assert 'section_name' in section
-            assert 'start_time' in section
-            assert 'end_time' in section
-            assert 'target_emotion' in section
-            assert 'emotion_label' in section
-            assert 0.0 <= section['target_emotion'] <= 1.0
-
-    def test_build_emotion_curve(self, test_session_id):
-        """Test building the emotion curve."""
-        builder = EmotionTargetBuilder(test_session_id, sampling_rate=1.0)
-        proposal = builder.load_phase2_data()
-        sections = proposal['sections']
-
-        total_duration = max(s.get('end_time', 0.0) for s in sections)
-        section_metadata = builder.build_section_metadata(sections)
-        curve = builder.build_emotion_curve(section_metadata, total_duration)
-
-        # Verify curve properties
-        assert len(curve) > 0
-        assert curve[0]['time'] == 0.0
-
-        # Check all required fields
-        for point in curve:
-            assert 'time' in point
-            assert 'emotion' in point
-            assert 'source_section' in point
-            assert 'label' in point
-            assert 0.0 <= point['emotion'] <= 1.0
-
-        # Verify time spacing matches sampling rate
-        if len(curve) > 1:
-            time_diff = curve[1]['time'] - curve[0]['time']
-            assert abs(time_diff - builder.sampling_rate) < 0.01
-
-    def test_emotion_statistics(self, test_session_id):
-        """Test emotion curve statistics calculation."""
-        builder = EmotionTargetBuilder(test_session_id)
-        proposal = builder.load_phase2_data()
-        sections = proposal['sections']
-
-        total_duration = max(s.get('end_time', 0.0) for s in sections)
-        section_metadata = builder.build_section_metadata(sections)
-        curve = builder.build_emotion_curve(section_metadata, total_duration)
-
-        stats = get_emotion_statistics(curve)
-
-        assert 'min_emotion' in stats
-        assert 'max_emotion' in stats
-        assert 'avg_emotion' in stats
-        assert 'total_samples' in stats
-        assert stats['total_samples'] == len(curve)
-        assert stats['min_emotion'] <= stats['avg_emotion'] <= stats['max_emotion']
-
-    def test_full_build_process(self, test_session_id):
-        """Test the complete build process."""
-        result = build_target_curve(test_session_id, sampling_rate=0.5)
-
-        assert 'curve' in result
-        assert 'sections' in result
-        assert 'statistics' in result
-        assert 'curve_path' in result
-
-        # Verify file was created
-        curve_path = Path(result['curve_path'])
-        assert curve_path.exists()
-
-        # Verify file contents
-        curve_data = read_json(str(curve_path))
-        assert 'metadata' in curve_data
-        assert 'curve' in curve_data
-        assert 'sections' in curve_data
-        assert 'statistics' in curve_data
-
-        # Verify metadata
-        assert curve_data['metadata']['session_id'] == test_session_id
-        assert curve_data['metadata']['source_phase'] == 2
-        assert curve_data['metadata']['sampling_rate'] == 0.5
-
-    def test_interpolation_at_section_boundaries(self, test_session_id):
-        """Test that interpolation works correctly at section boundaries."""
-        builder = EmotionTargetBuilder(test_session_id, sampling_rate=0.1)
-        proposal = builder.load_phase2_data()
-        sections = proposal['sections']
+    @pytest.fixture(scope="session")
+    def builder(test_session_id):
+        """Builder shared by all tests (loads the session once)."""
+        return EmotionTargetBuilder(test_session_id)
 
-        total_duration = max(s.get('end_time', 0.0) for s in sections)
-        section_metadata = builder.build_section_metadata(sections)
-        curve = builder.build_emotion_curve(section_metadata, total_duration)
+    @pytest.fixture(scope="session")
+    def proposal(builder):
+        """Phase 2 winner proposal, parsed once per test session."""
+        return builder.load_phase2_data()
 
-        # Find points near section boundaries and verify smooth transitions
-        for i in range(len(section_metadata) - 1):
-            section_end = section_metadata[i]['end_time']
+    @pytest.fixture(scope="session")
+    def section_metadata(builder, proposal):
+        """Section metadata built once from the shared proposal."""
+        return builder.build_section_metadata(proposal['sections'])
 
-            # Find curve points near this boundary
-            nearby_points = [
-                p for p in curve
-                if abs(p['time'] - section_end) < 2.0
-            ]
+    class TestEmotionTargetBuilder:
+        """Test suite for EmotionTargetBuilder."""
 
-            # Should have multiple points for smooth transition
-            assert len(nearby_points) > 0
+        def test_emotion_mapping(self):
+            """Test emotion keyword to value mapping."""
+            # Test exact matches
+            value, label = map_emotion_to_value("mysterious")
+            assert value == 0.4
+            assert label == "mysterious"
+
+            value, label = map_emotion_to_value("intense")
+            assert value == 1.0
+            assert label == "intense"
+
+            value, label = map_emotion_to_value("calm")
+            assert value == 0.2
+            assert label == "calm"
+
+        def test_emotion_mapping_composite(self):
+            """Test mapping of composite emotion descriptions."""
+            value, label = map_emotion_to_value("emotional, artistic intro")
+            assert 0.5 <= value <= 0.7  # Should match "emotional"
+
+            value, label = map_emotion_to_value("upbeat and energetic")
+            assert value == 0.8  # Should match "upbeat" or "energetic"
+
+        def test_builder_initialization(self, builder, test_session_id):
+            """Test builder initialization."""
+            assert builder.session_id == test_session_id
+            assert builder.sampling_rate == 0.5
+            assert builder.session is not None
+
+        def test_load_phase2_data(self, proposal):
+            """Test loading Phase 2 data."""
+            assert 'sections' in proposal
+            assert len(proposal['sections']) > 0
+
+        def test_build_section_metadata(self, builder, proposal):
+            """Test building section metadata with emotion values."""
+            sections = proposal['sections']
+
+            metadata = builder.build_section_metadata(sections)
+
+            assert len(metadata) == len(sections)
+            for section in metadata:
+                assert 'section_name' in section
+                assert 'start_time' in section
+                assert 'end_time' in section
+                assert 'target_emotion' in section
+                assert 'emotion_label' in section
+                assert 0.0 <= section['target_emotion'] <= 1.0
+
+        def test_build_emotion_curve(self, builder, section_metadata):
+            """Test building the emotion curve."""
+            builder = copy.copy(builder)
+            builder.sampling_rate = 1.0
+            curve = builder.build_emotion_curve(
+                section_metadata, builder.total_duration
+            )
+
+            # Verify curve properties
+            assert len(curve) > 0
+            assert curve[0]['time'] == 0.0
+
+            # Check all required fields
+            for point in curve:
+                assert 'time' in point
+                assert 'emotion' in point
+                assert 'source_section' in point
+                assert 'label' in point
+                assert 0.0 <= point['emotion'] <= 1.0
+
+            # Verify time spacing matches sampling rate
+            if len(curve) > 1:
+                time_diff = curve[1]['time'] - curve[0]['time']
+                assert abs(time_diff - builder.sampling_rate) < 0.01
+
+        def test_build_curve_columns(self, builder, section_metadata):
+            """Test that the column-oriented curve matches the point list."""
+            columns = builder.build_curve_columns(
+                section_metadata, builder.total_duration
+            )
+            curve = builder.build_emotion_curve(
+                section_metadata, builder.total_duration
+            )
+
+            assert len(columns['time']) == len(curve)
+            assert unpack_emotion_curve(columns) == curve
+            assert get_value_statistics(columns['emotion']) == get_emotion_statistics(curve)
+
+        def test_emotion_statistics(self, builder, section_metadata):
+            """Test emotion curve statistics calculation."""
+            curve = builder.build_emotion_curve(
+                section_metadata, builder.total_duration
+            )
+
+            stats = get_emotion_statistics(curve)
+
+            assert 'min_emotion' in stats
+            assert 'max_emotion' in stats
+            assert 'avg_emotion' in stats
+            assert 'total_samples' in stats
+            assert stats['total_samples'] == len(curve)
+            assert stats['min_emotion'] <= stats['avg_emotion'] <= stats['max_emotion']
+
+        def test_full_build_process(self, test_session_id):
+            """Test the complete build process."""
+            result = build_target_curve(test_session_id, sampling_rate=0.5)
+
+            assert 'curve' in result
+            assert 'sections' in result
+            assert 'statistics' in result
+            assert 'curve_path' in result
+
+            # Verify file was created
+            curve_path = Path(result['curve_path'])
+            assert curve_path.exists()
+
+            # Verify file contents
+            curve_data = load_emotion_curve(str(curve_path))
+            assert 'metadata' in curve_data
+            assert 'curve_columns' in curve_data
+            assert curve_data['curve'] == result['curve']
+            assert 'sections' in curve_data
+            assert 'statistics' in curve_data
+
+            # Verify metadata
+            assert curve_data['metadata']['session_id'] == test_session_id
+            assert curve_data['metadata']['source_phase'] == 2
+            assert curve_data['metadata']['sampling_rate'] == 0.5
+
+        def test_interpolation_at_section_boundaries(self, builder,
+                                                     section_metadata):
+            """Test that interpolation works correctly at section boundaries."""
+            builder = copy.copy(builder)
+            builder.sampling_rate = 0.1
+            curve = builder.build_emotion_curve(
+                section_metadata, builder.total_duration
+            )
+
+            # Find points near section boundaries and verify smooth transitions
+            for i in range(len(section_metadata) - 1):
+                section_end = section_metadata[i]['end_time']
+
+                # Find curve points near this boundary
+                nearby_points = [
+                    p for p in curve
+                    if abs(p['time'] - section_end) < 2.0
+                ]
+
+                # Should have multiple points for smooth transition
+                assert len(nearby_points) > 0
 
 
 def test_emotion_utils():
@@ -199,7 +219,9 @@ def test_emotion_utils():
         map_emotion_to_value,
         interpolate_linear,
         interpolate_smooth,
-        normalize_emotion_curve
+        normalize_emotion_curve,
+        pack_emotion_curve,
+        unpack_emotion_curve
     )
 
     # Test linear interpolation
@@ -221,6 +243,17 @@ def test_emotion_utils():
     assert normalized[-1]['emotion'] == 1.0  # Max maps to 1
     assert 0.0 < normalized[1]['emotion'] < 1.0  # Middle value
 
+    # Test columnar packing round-trip
+    test_curve = [
+        {'time': 0.0, 'emotion': 0.4, 'source_section': 'intro', 'label': 'calm'},
+        {'time': 0.5, 'emotion': 0.5, 'source_section': 'intro', 'label': 'calm→joy'},
+        {'time': 1.0, 'emotion': 0.75, 'source_section': 'verse', 'label': 'joy'}
+    ]
+    packed = pack_emotion_curve(test_curve)
+    assert packed['section_names'] == ['intro', 'verse']
+    assert packed['source_section'] == [0, 0, 1]
+    assert unpack_emotion_curve(packed) == test_curve
+
 
 def main():
     """Run tests manually if not using pytest."""
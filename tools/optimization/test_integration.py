@@ -22,19 +22,19 @@ def test_phase2_integration():
     print("=" * 60)
 
     # Create a new session for testing
-    session = SharedState.create_session({
-        'analysis': str(get_project_root() / "sample_analysis.json")
-    })
+    analysis_path = str(get_project_root() / "sample_analysis.json")
+    session = SharedState.create_session({'analysis': analysis_path})
     session_id = session.session_id
     print(f"\nCreated test session: {session_id}")
 
-    # Manually complete Phase 0 and 1 (simplified for testing)
+    # Manually complete Phase 0 and 1 (simplified for testing). The session
+    # is new, so neither phase can have been completed yet
     print("\nSetting up Phase 0 and Phase 1...")
     from phase0.runner import run_phase0
     from phase1.runner import run_phase1
 
     try:
-        run_phase0(session_id, mock_mode=True)
+        run_phase0(session_id, analysis_path, mock_mode=True)
         print("✓ Phase 0 completed")
     except Exception as e:
         print(f"! Phase 0 setup: {e}")
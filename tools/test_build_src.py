@@ -3,485 +3,232 @@
 Test suite for build_src.py
 
 Tests the SRC (lyrics timecode) generation tool with various modes.
+
+Run with: python -m pytest tools/test_build_src.py -n auto
+Or: python tools/test_build_src.py
 """
 
 import sys
-import json
-import tempfile
-import subprocess
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.utils import read_json
-
-
-def create_test_mp3(duration: float = 60.0) -> str:
-    """
-    Create a test MP3 file using ffmpeg.
-
-    Args:
-        duration: Duration in seconds
+import pytest
+
+from core.utils import read_json_cached
+from tools.audio_utils import check_ffmpeg_available
+from tools.build_src import main as build_src_main
+from tools.tests._fixtures import make_silent_mp3, make_test_lyrics
+from tools.tests._schema import compile_schema
+
+
+# Structure of src.json, compiled once and shared by all tests
+SRC_SCHEMA = {
+    "type": "object",
+    "required": ["metadata", "lines", "total_lines", "coverage"],
+    "properties": {
+        "metadata": {
+            "type": "object",
+            "required": ["mode_used", "created_at", "source_audio",
+                         "source_lyrics", "duration"],
+        },
+        "lines": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["index", "text", "start_time", "end_time", "duration"],
+            },
+        },
+        "total_lines": {"type": "integer"},
+        "coverage": {
+            "type": "object",
+            "required": ["first_line_start", "last_line_end", "total_duration"],
+        },
+    },
+}
+
+validate_src = compile_schema(SRC_SCHEMA)
+
+# Lyrics shared by the SRC tests
+SRC_LYRICS = (
+    "First line of the song",
+    "Second line continues",
+    "Third line builds up",
+    "Fourth line is the hook",
+    "Fifth line slows down",
+    "Sixth line wraps up",
+)
+
+
+# build_src.py reads the audio duration with ffprobe
+requires_ffmpeg = pytest.mark.skipif(
+    not check_ffmpeg_available(),
+    reason="ffmpeg/ffprobe not installed"
+)
+
+
+@requires_ffmpeg
+def test_heuristic_mode(tmp_path):
+    """Test heuristic mode (should always work)."""
+    mp3_path = make_silent_mp3(60.0)
+    assert mp3_path, "Failed to create test MP3"
+    lyrics_path = make_test_lyrics(SRC_LYRICS)
 
-    Returns:
-        Path to temporary MP3 file
-    """
-    temp_mp3 = tempfile.NamedTemporaryFile(suffix='.mp3', delete=False)
-    temp_mp3.close()
+    output_path = str(tmp_path / "src.json")
 
-    # Generate silent audio
-    cmd = [
-        "ffmpeg",
-        "-f", "lavfi",
-        "-i", f"anullsrc=r=44100:cl=stereo",
-        "-t", str(duration),
-        "-c:a", "libmp3lame",
-        "-b:a", "128k",
-        "-y",
-        temp_mp3.name
-    ]
+    exit_code = build_src_main([
+        "--mp3", mp3_path,
+        "--lyrics", lyrics_path,
+        "--output", output_path,
+        "--mode", "heuristic"
+    ])
+    assert exit_code == 0, "build_src.py failed"
 
-    try:
-        subprocess.run(cmd, capture_output=True, check=True, timeout=30)
-        return temp_mp3.name
-    except Exception as e:
-        print(f"Error creating test MP3: {e}")
-        return None
+    src = read_json_cached(output_path)
 
+    # Check structure (required fields)
+    validate_src(src)
 
-def create_test_lyrics() -> str:
-    """
-    Create a test lyrics file.
+    # Check metadata
+    assert src["metadata"]["mode_used"] == "heuristic"
 
-    Returns:
-        Path to temporary lyrics file
-    """
-    lyrics = [
-        "First line of the song",
-        "Second line continues",
-        "Third line builds up",
-        "Fourth line is the hook",
-        "Fifth line slows down",
-        "Sixth line wraps up"
-    ]
+    # Check lines
+    lines = src["lines"]
+    assert len(lines) > 0
+    assert src["total_lines"] == len(lines)
 
-    temp_lyrics = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False)
-    temp_lyrics.write('\n'.join(lyrics))
-    temp_lyrics.close()
+    for i, line in enumerate(lines):
+        assert line["index"] == i
+        assert line["start_time"] < line["end_time"]
 
-    return temp_lyrics.name
+    # Check timing is reasonable
+    for i in range(len(lines) - 1):
+        current_end = lines[i]["end_time"]
+        next_start = lines[i + 1]["start_time"]
+        # Lines should be adjacent or close
+        assert abs(next_start - current_end) < 0.1, f"Gap between lines {i} and {i+1}"
 
 
-def test_heuristic_mode():
-    """Test heuristic mode (should always work)."""
-    print("=" * 60)
-    print("TEST 1: Heuristic Mode (No Dependencies)")
-    print("=" * 60)
-
-    # Create test files
-    print("\n[1/4] Creating test files...")
-    mp3_path = create_test_mp3(duration=60.0)
-    if not mp3_path:
-        print("✗ Failed to create test MP3")
-        return False
-
-    lyrics_path = create_test_lyrics()
-    output_path = tempfile.NamedTemporaryFile(suffix='.json', delete=False).name
-
-    print("✓ Test files created")
-
-    # Run build_src.py in heuristic mode
-    print("\n[2/4] Running build_src.py (heuristic mode)...")
-    cmd = [
-        "python3",
-        str(Path(__file__).parent / "build_src.py"),
-        "--mp3", mp3_path,
-        "--lyrics", lyrics_path,
-        "--output", output_path,
-        "--mode", "heuristic"
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"✗ build_src.py failed with code {result.returncode}")
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
-        return False
+@requires_ffmpeg
+def test_auto_mode(tmp_path):
+    """Test auto mode (should fall back to heuristic if aeneas unavailable)."""
+    mp3_path = make_silent_mp3(30.0)
+    assert mp3_path, "Failed to create test MP3"
+    lyrics_path = make_test_lyrics(SRC_LYRICS)
 
-    print("✓ build_src.py completed")
+    output_path = str(tmp_path / "src.json")
 
-    # Validate output
-    print("\n[3/4] Validating output...")
-    try:
-        src = read_json(output_path)
-
-        # Check required fields
-        required_fields = ["metadata", "lines", "total_lines", "coverage"]
-        for field in required_fields:
-            if field not in src:
-                print(f"✗ Missing required field: {field}")
-                return False
-
-        # Check metadata
-        metadata = src["metadata"]
-        assert metadata["mode_used"] == "heuristic"
-        assert "created_at" in metadata
-        assert "source_audio" in metadata
-        assert "source_lyrics" in metadata
-
-        # Check lines
-        lines = src["lines"]
-        assert len(lines) > 0
-        assert src["total_lines"] == len(lines)
-
-        for i, line in enumerate(lines):
-            assert line["index"] == i
-            assert "text" in line
-            assert "start_time" in line
-            assert "end_time" in line
-            assert "duration" in line
-            assert line["start_time"] < line["end_time"]
-
-        # Check coverage
-        coverage = src["coverage"]
-        assert "first_line_start" in coverage
-        assert "last_line_end" in coverage
-        assert "total_duration" in coverage
-
-        print("✓ All validation checks passed")
-        print(f"\nSummary:")
-        print(f"  Mode: {metadata['mode_used']}")
-        print(f"  Total lines: {src['total_lines']}")
-        print(f"  First line: {lines[0]['start_time']:.2f}s")
-        print(f"  Last line: {lines[-1]['end_time']:.2f}s")
-
-        # Check timing is reasonable
-        print("\n[4/4] Checking timing distribution...")
-        for i in range(len(lines) - 1):
-            current_end = lines[i]["end_time"]
-            next_start = lines[i + 1]["start_time"]
-            # Lines should be adjacent or close
-            assert abs(next_start - current_end) < 0.1, f"Gap between lines {i} and {i+1}"
-
-        print("✓ Timing distribution looks good")
-
-        return True
-
-    except Exception as e:
-        print(f"✗ Validation failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-    finally:
-        # Cleanup
-        try:
-            Path(mp3_path).unlink()
-            Path(lyrics_path).unlink()
-            Path(output_path).unlink()
-        except:
-            pass
-
-
-def test_auto_mode():
-    """Test auto mode (should fall back to heuristic if aeneas unavailable)."""
-    print("\n" + "=" * 60)
-    print("TEST 2: Auto Mode (Graceful Fallback)")
-    print("=" * 60)
-
-    # Create test files
-    print("\n[1/3] Creating test files...")
-    mp3_path = create_test_mp3(duration=30.0)
-    if not mp3_path:
-        print("✗ Failed to create test MP3")
-        return False
-
-    lyrics_path = create_test_lyrics()
-    output_path = tempfile.NamedTemporaryFile(suffix='.json', delete=False).name
-
-    print("✓ Test files created")
-
-    # Run build_src.py in auto mode
-    print("\n[2/3] Running build_src.py (auto mode)...")
-    cmd = [
-        "python3",
-        str(Path(__file__).parent / "build_src.py"),
+    exit_code = build_src_main([
         "--mp3", mp3_path,
         "--lyrics", lyrics_path,
         "--output", output_path,
         "--mode", "auto"
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"✗ build_src.py failed with code {result.returncode}")
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
-        return False
-
-    print("✓ build_src.py completed")
+    ])
+    assert exit_code == 0, "build_src.py failed"
 
-    # Validate output
-    print("\n[3/3] Validating output...")
-    try:
-        src = read_json(output_path)
-
-        # Check that some mode was used
-        mode_used = src["metadata"]["mode_used"]
-        print(f"  Mode used: {mode_used}")
-
-        # Should be either aeneas or heuristic
-        assert mode_used in ["aeneas", "heuristic"]
+    src = read_json_cached(output_path)
 
-        # Basic validation
-        assert len(src["lines"]) > 0
-        assert src["total_lines"] == len(src["lines"])
+    # Should be either aeneas or heuristic
+    assert src["metadata"]["mode_used"] in ["aeneas", "heuristic"]
 
-        print("✓ Auto mode worked correctly")
-        return True
+    # Basic validation
+    assert len(src["lines"]) > 0
+    assert src["total_lines"] == len(src["lines"])
 
-    except Exception as e:
-        print(f"✗ Validation failed: {e}")
-        return False
 
-    finally:
-        try:
-            Path(mp3_path).unlink()
-            Path(lyrics_path).unlink()
-            Path(output_path).unlink()
-        except:
-            pass
+@requires_ffmpeg
+def test_output_format(tmp_path):
+    """Test that output format matches specification."""
+    mp3_path = make_silent_mp3(45.0)
+    assert mp3_path, "Failed to create test MP3"
+    lyrics_path = make_test_lyrics(SRC_LYRICS)
 
+    output_path = str(tmp_path / "src.json")
 
-def test_output_format():
-    """Test that output format matches specification."""
-    print("\n" + "=" * 60)
-    print("TEST 3: Output Format Verification")
-    print("=" * 60)
-
-    # Create test files
-    mp3_path = create_test_mp3(duration=45.0)
-    if not mp3_path:
-        print("✗ Failed to create test MP3")
-        return False
-
-    lyrics_path = create_test_lyrics()
-    output_path = tempfile.NamedTemporaryFile(suffix='.json', delete=False).name
-
-    # Run SRC generation
-    cmd = [
-        "python3",
-        str(Path(__file__).parent / "build_src.py"),
+    exit_code = build_src_main([
         "--mp3", mp3_path,
         "--lyrics", lyrics_path,
         "--output", output_path,
         "--mode", "heuristic"
-    ]
+    ])
+    assert exit_code == 0, "build_src.py failed"
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    src = read_json_cached(output_path)
 
-    if result.returncode != 0:
-        print("✗ build_src.py failed")
-        return False
+    # Verify metadata, lines and coverage structure
+    validate_src(src)
+
+    # Verify total_lines
+    assert src["total_lines"] == len(src["lines"])
 
-    # Check format details
-    try:
-        src = read_json(output_path)
-
-        # Verify metadata structure
-        metadata = src["metadata"]
-        assert "mode_used" in metadata
-        assert "created_at" in metadata
-        assert "source_audio" in metadata
-        assert "source_lyrics" in metadata
-        assert "duration" in metadata
-
-        # Verify lines structure
-        for line in src["lines"]:
-            assert "index" in line
-            assert "text" in line
-            assert "start_time" in line
-            assert "end_time" in line
-            assert "duration" in line
-
-        # Verify coverage structure
-        coverage = src["coverage"]
-        assert "first_line_start" in coverage
-        assert "last_line_end" in coverage
-        assert "total_duration" in coverage
-
-        # Verify total_lines
-        assert "total_lines" in src
-        assert src["total_lines"] == len(src["lines"])
-
-        print("✓ Output format matches specification")
-        return True
-
-    except Exception as e:
-        print(f"✗ Format validation failed: {e}")
-        return False
-
-    finally:
-        try:
-            Path(mp3_path).unlink()
-            Path(lyrics_path).unlink()
-            Path(output_path).unlink()
-        except:
-            pass
-
-
-def test_missing_file():
-    """Test error handling for missing files."""
-    print("\n" + "=" * 60)
-    print("TEST 4: Missing File Error Handling")
-    print("=" * 60)
 
-    output_path = tempfile.NamedTemporaryFile(suffix='.json', delete=False).name
+def test_missing_file(tmp_path):
+    """Test error handling for missing files."""
+    output_path = str(tmp_path / "src.json")
 
-    cmd = [
-        "python3",
-        str(Path(__file__).parent / "build_src.py"),
+    exit_code = build_src_main([
         "--mp3", "/nonexistent/file.mp3",
         "--lyrics", "/nonexistent/lyrics.txt",
         "--output", output_path
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode == 0:
-        print("✗ Should have failed with missing file")
-        return False
-
-    print("✓ Correctly reported missing file error")
-    return True
+    ])
+    assert exit_code != 0, "Should have failed with missing file"
 
 
-def test_timing_accuracy():
+@requires_ffmpeg
+def test_timing_accuracy(tmp_path):
     """Test that timing is sensible."""
-    print("\n" + "=" * 60)
-    print("TEST 5: Timing Accuracy Check")
-    print("=" * 60)
-
     # Create test files with known duration
     duration = 100.0
-    mp3_path = create_test_mp3(duration=duration)
-    if not mp3_path:
-        print("✗ Failed to create test MP3")
-        return False
+    mp3_path = make_silent_mp3(duration)
+    assert mp3_path, "Failed to create test MP3"
 
     # Create lyrics with known number of lines
-    lyrics = [f"Line {i+1}" for i in range(10)]
-    temp_lyrics = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False)
-    temp_lyrics.write('\n'.join(lyrics))
-    temp_lyrics.close()
-    lyrics_path = temp_lyrics.name
-
-    output_path = tempfile.NamedTemporaryFile(suffix='.json', delete=False).name
-
-    # Run SRC generation
-    cmd = [
-        "python3",
-        str(Path(__file__).parent / "build_src.py"),
+    lyrics_path = make_test_lyrics(tuple(f"Line {i+1}" for i in range(10)))
+
+    output_path = str(tmp_path / "src.json")
+
+    exit_code = build_src_main([
         "--mp3", mp3_path,
         "--lyrics", lyrics_path,
         "--output", output_path,
         "--mode", "heuristic"
-    ]
+    ])
+    assert exit_code == 0, "build_src.py failed"
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print("✗ build_src.py failed")
-        return False
-
-    try:
-        src = read_json(output_path)
+    src = read_json_cached(output_path)
 
-        # Check timing constraints
-        lines = src["lines"]
+    # Check timing constraints on start/end columns
+    lines = src["lines"]
+    starts = [line["start_time"] for line in lines]
+    ends = [line["end_time"] for line in lines]
 
-        # All lines should be within audio duration
-        for line in lines:
-            assert 0 <= line["start_time"] <= duration
-            assert 0 <= line["end_time"] <= duration
-            assert line["start_time"] < line["end_time"]
+    # All lines should be non-empty and within audio duration
+    assert all(0 <= start < end <= duration for start, end in zip(starts, ends))
 
-        # Lines should be in order
-        for i in range(len(lines) - 1):
-            assert lines[i]["end_time"] <= lines[i + 1]["start_time"] + 0.1
+    # Lines should be in order
+    assert all(end <= next_start + 0.1 for end, next_start in zip(ends, starts[1:]))
 
-        # Coverage should match duration
-        coverage = src["coverage"]
-        assert coverage["total_duration"] == duration
+    # Coverage should match duration (up to MP3 frame padding, which
+    # ffprobe cannot strip from lameenc output without a LAME tag)
+    coverage = src["coverage"]
+    assert coverage["total_duration"] == pytest.approx(duration, abs=0.1)
 
-        # First and last lines should be reasonably placed
-        assert coverage["first_line_start"] >= 0
-        assert coverage["last_line_end"] <= duration
-
-        print("✓ Timing accuracy checks passed")
-        print(f"  Duration: {duration}s")
-        print(f"  Lines: {len(lines)}")
-        print(f"  Coverage: {coverage['first_line_start']:.1f}s - {coverage['last_line_end']:.1f}s")
-        print(f"  Avg line duration: {sum(l['duration'] for l in lines) / len(lines):.2f}s")
-
-        return True
-
-    except Exception as e:
-        print(f"✗ Timing validation failed: {e}")
-        return False
-
-    finally:
-        try:
-            Path(mp3_path).unlink()
-            Path(lyrics_path).unlink()
-            Path(output_path).unlink()
-        except:
-            pass
+    # First and last lines should be reasonably placed
+    assert coverage["first_line_start"] >= 0
+    assert coverage["last_line_end"] <= duration
 
 
 def main():
-    """Run all tests."""
-    print("\n" + "=" * 60)
-    print("BUILD_SRC.PY TEST SUITE")
-    print("=" * 60)
-
-    tests = [
-        ("Heuristic Mode", test_heuristic_mode),
-        ("Auto Mode", test_auto_mode),
-        ("Output Format Verification", test_output_format),
-        ("Missing File Error Handling", test_missing_file),
-        ("Timing Accuracy Check", test_timing_accuracy),
-    ]
-
-    results = []
-    for name, test_func in tests:
-        try:
-            passed = test_func()
-            results.append((name, passed))
-        except Exception as e:
-            print(f"\n✗ Test '{name}' crashed: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-
-    for name, result in results:
-        status = "✓ PASS" if result else "✗ FAIL"
-        print(f"{status}: {name}")
-
-    print(f"\nTotal: {passed}/{total} tests passed")
-
-    return 0 if passed == total else 1
+    """Run all tests, in parallel when pytest-xdist is installed."""
+    args = [__file__, "-v"]
+    try:
+        import xdist  # noqa: F401
+        args += ["-n", "auto"]
+    except ImportError:
+        pass
+    return pytest.main(args)
 
 
 if __name__ == "__main__":
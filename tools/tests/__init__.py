@@ -0,0 +1,3 @@
+"""
+Shared helpers for the tools test suites.
+"""
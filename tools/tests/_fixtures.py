@@ -0,0 +1,158 @@
+"""
+Shared test inputs for the build tool test suites.
+
+Both helpers are cached per process, so each distinct MP3 duration or
+lyrics text is created once and reused by every test module (and by
+each pytest-xdist worker).
+
+Silent MP3s are also kept on disk in MP3_CACHE_DIR, so a duration is
+encoded once ever rather than once per run; the build tools only read
+them. Delete the directory to force re-encoding. Lyrics files live in a
+temporary directory that is removed at interpreter exit.
+"""
+
+import atexit
+import functools
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    import lameenc
+except ImportError:
+    lameenc = None  # Fall back to ffmpeg
+
+
+# Persistent cache of encoded silent MP3s (ignored by git)
+MP3_CACHE_DIR = Path(__file__).parent / ".fixture_cache"
+
+DEFAULT_LINES = (
+    "This is the first line",
+    "This is the second line",
+    "Chorus comes here now",
+    "With more words to sing",
+    "",
+    "Verse two begins",
+    "With different content",
+    "But same melody",
+    "",
+    "Final chorus line",
+    "To end the song",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _fixture_dir() -> Path:
+    """Create the temporary directory holding generated lyrics files."""
+    path = Path(tempfile.mkdtemp(prefix="mv_orchestra_tools_test_"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def _encode_silent_mp3(mp3_path: Path, duration: float) -> bool:
+    """
+    Encode a silent stereo 44.1 kHz 128 kbps MP3.
+
+    Encodes in-process with lameenc when it is installed, otherwise
+    shells out to ffmpeg.
+
+    Args:
+        mp3_path: Path to write the MP3 to
+        duration: Duration in seconds
+
+    Returns:
+        True if encoding succeeded
+    """
+    if lameenc is not None:
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(128)
+        encoder.set_in_sample_rate(44100)
+        encoder.set_channels(2)
+        encoder.set_quality(7)
+
+        # Silent 16-bit stereo PCM, fed one second at a time
+        silence = bytes(44100 * 4)
+        frames_left = int(44100 * duration)
+        mp3_data = bytearray()
+        while frames_left > 0:
+            frames = min(44100, frames_left)
+            mp3_data += encoder.encode(silence[:frames * 4])
+            frames_left -= frames
+        mp3_data += encoder.flush()
+
+        mp3_path.write_bytes(mp3_data)
+        return True
+
+    # Generate silent audio
+    cmd = [
+        "ffmpeg",
+        "-f", "lavfi",
+        "-i", f"anullsrc=r=44100:cl=stereo",
+        "-t", str(duration),
+        "-c:a", "libmp3lame",
+        "-b:a", "128k",
+        "-f", "mp3",
+        "-y",
+        str(mp3_path)
+    ]
+
+    try:
+        subprocess.run(cmd, capture_output=True, check=True, timeout=30)
+        return True
+    except Exception as e:
+        print(f"Error creating test MP3: {e}")
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def make_silent_mp3(duration: float) -> Optional[str]:
+    """
+    Get a silent test MP3 file, encoding it on first use.
+
+    Args:
+        duration: Duration in seconds
+
+    Returns:
+        Path to the MP3 file, or None if encoding failed
+    """
+    mp3_path = MP3_CACHE_DIR / f"silent_{duration:.1f}s.mp3"
+    if mp3_path.exists():
+        return str(mp3_path)
+
+    MP3_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Encode to a private name and rename, so concurrent workers never
+    # see a partially written file
+    fd, tmp_name = tempfile.mkstemp(suffix=".part", dir=MP3_CACHE_DIR)
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+
+    try:
+        if not _encode_silent_mp3(tmp_path, duration):
+            return None
+        os.replace(tmp_path, mp3_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return str(mp3_path)
+
+
+@functools.lru_cache(maxsize=None)
+def make_test_lyrics(lines: Tuple[str, ...] = DEFAULT_LINES) -> str:
+    """
+    Create a test lyrics file.
+
+    Args:
+        lines: Lyrics lines (a tuple, so it can be cached)
+
+    Returns:
+        Path to the lyrics file
+    """
+    fd, lyrics_path = tempfile.mkstemp(suffix=".txt", prefix="lyrics_", dir=_fixture_dir())
+    with open(fd, "w", encoding="utf-8") as f:
+        f.write('\n'.join(lines))
+
+    return lyrics_path
@@ -0,0 +1,53 @@
+"""
+JSON Schema validation helpers for the tools test suites.
+
+Schemas are compiled once (typically at test module import) and the
+resulting validator is reused for every document. Uses jsonschema when
+installed; otherwise only the schema's required keys are checked.
+"""
+
+from typing import Any, Callable, Dict
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+
+def _check_required(schema: Dict[str, Any], value: Any, path: str = "$") -> None:
+    """Check required keys, following properties and items (the fallback)."""
+    if isinstance(value, dict):
+        missing = [key for key in schema.get("required", ()) if key not in value]
+        assert not missing, f"{path}: missing required field(s) {missing}"
+
+        for name, sub in schema.get("properties", {}).items():
+            if name in value:
+                _check_required(sub, value[name], f"{path}.{name}")
+
+    elif isinstance(value, list) and "items" in schema:
+        for i, item in enumerate(value):
+            _check_required(schema["items"], item, f"{path}[{i}]")
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], None]:
+    """
+    Compile a JSON Schema into a reusable validator.
+
+    Args:
+        schema: JSON Schema dictionary
+
+    Returns:
+        Function that validates a document, raising AssertionError on mismatch
+    """
+    if jsonschema is None:
+        return lambda document: _check_required(schema, document)
+
+    validator = jsonschema.validators.validator_for(schema)(schema)
+
+    def validate(document: Any) -> None:
+        try:
+            validator.validate(document)
+        except jsonschema.ValidationError as e:
+            raise AssertionError(str(e)) from None
+
+    return validate
@@ -0,0 +1,15 @@
+"""
+pytest configuration for validator tests.
+
+Puts the project root on sys.path once for the whole directory, so the
+test modules can import core and tools.validators without each doing
+their own path setup.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
@@ -6,15 +6,17 @@ MV Orchestra orchestration pipeline.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Hashable, List, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core import SharedState
 from tools.validators import validate_clip_division, validate_phase4_strategies
+from tools.validators.validate_clip_division import get_report_cache_key as get_phase3_cache_key
+from tools.validators.validation_utils import get_session_cache_key
 
 
 # Configure logging
@@ -24,6 +26,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Checks that must pass to proceed in non-strict mode, cheapest first
+CRITICAL_CHECKS = {
+    3: ('clip_id_uniqueness', 'timing_consistency'),
+    4: ('strategy_completeness', 'generation_mode_validity')
+}
+
+# Result used for a critical check missing from a report
+_EMPTY_RESULT: Dict[str, Any] = {}
+
+# Cache key functions for everything a phase's validation report is built
+# from; phases not listed only read the session's state.json
+_REPORT_CACHE_KEYS = {
+    3: get_phase3_cache_key
+}
+
+# Full validation reports by (session_id, phase), with the cache key they
+# were built from; an entry is stale once any of its inputs is rewritten
+_REPORT_CACHE: Dict[Tuple[str, int], Tuple[Hashable, Dict[str, Any]]] = {}
+
+
+def _report_cache_key(session_id: str, phase: int) -> Optional[Hashable]:
+    """Get the cache key for a phase's validation report (None if no session)."""
+    return _REPORT_CACHE_KEYS.get(phase, get_session_cache_key)(session_id)
+
+
+def _get_cached_report(session_id: str, phase: int) -> Optional[Dict[str, Any]]:
+    """Return the cached full report for a phase if the session is unchanged."""
+    cached = _REPORT_CACHE.get((session_id, phase))
+    if cached is None:
+        return None
+
+    cache_key, report = cached
+    if cache_key != _report_cache_key(session_id, phase):
+        # pop: a concurrent gate may already have dropped the stale entry
+        _REPORT_CACHE.pop((session_id, phase), None)
+        return None
+
+    return report
+
+
+def _cache_report(session_id: str, phase: int, cache_key: Optional[Hashable],
+                  report: Dict[str, Any]) -> None:
+    """Cache a full report built from the session as of cache_key."""
+    if cache_key is not None:
+        _REPORT_CACHE[(session_id, phase)] = (cache_key, report)
+
 
 def run_phase_with_validation(
     session_id: str,
@@ -46,41 +94,45 @@ def run_phase_with_validation(
     Raises:
         RuntimeError: If validation fails critically
     """
-    logger.info(f"Running Phase {phase_number}...")
+    logger.info("Running Phase %d...", phase_number)
 
     # Run the phase
     try:
         results = phase_runner_func(session_id)
-        logger.info(f"Phase {phase_number} completed successfully")
+        logger.info("Phase %d completed successfully", phase_number)
     except Exception as e:
-        logger.error(f"Phase {phase_number} failed: {e}")
+        logger.error("Phase %d failed: %s", phase_number, e)
         raise
 
     # Run validation if provided
     if validator_func:
-        logger.info(f"Validating Phase {phase_number} output...")
+        logger.info("Validating Phase %d output...", phase_number)
 
         try:
+            cache_key = _report_cache_key(session_id, phase_number)
             validation_report = validator_func(session_id)
+            _cache_report(session_id, phase_number, cache_key, validation_report)
 
             if validation_report['summary']['overall_status'] == 'PASS':
-                logger.info(f"Phase {phase_number} validation: PASS")
+                logger.info("Phase %d validation: PASS", phase_number)
             else:
                 failed_checks = validation_report['summary']['failed_checks']
                 warnings = validation_report['summary']['warnings']
 
+                # Log specific failures as one multi-line record
+                failures = [
+                    f"  - {check_name}: {check_result['message']}"
+                    for check_name, check_result in validation_report['validation_results'].items()
+                    if not check_result.get('passed', True)
+                ]
                 logger.warning(
-                    f"Phase {phase_number} validation: FAIL "
-                    f"({failed_checks} failed checks, {warnings} warnings)"
+                    "Phase %d validation: FAIL (%d failed checks, %d warnings)%s",
+                    phase_number, failed_checks, warnings,
+                    "".join("\n" + line for line in failures)
                 )
 
-                # Log specific failures
-                for check_name, check_result in validation_report['validation_results'].items():
-                    if not check_result.get('passed', True):
-                        logger.warning(f"  - {check_name}: {check_result['message']}")
-
         except Exception as e:
-            logger.error(f"Validation failed with error: {e}")
+            logger.error("Validation failed with error: %s", e)
             # Don't raise - validation failure shouldn't stop the pipeline
 
     return results
@@ -96,7 +148,7 @@ def run_orchestration_with_validation(session_id: str) -> None:
     from phase3.runner import run_phase3
     from phase4.runner import run_phase4
 
-    logger.info(f"Starting orchestration with validation for session {session_id}")
+    logger.info("Starting orchestration with validation for session %s", session_id)
 
     # Phase 3: Clip Division (with validation)
     phase3_results = run_phase_with_validation(
@@ -124,61 +176,109 @@ def validate_before_next_phase(session_id: str, phase: int, strict: bool = False
     Args:
         session_id: Session identifier
         phase: Phase number to validate
-        strict: If True, fail on any validation error. If False, only fail on critical errors.
+        strict: If True, run all checks and fail on any validation error.
+            If False, run and fail on only the CRITICAL_CHECKS for the phase.
 
     Returns:
         True if validation passes, False otherwise
     """
-    logger.info(f"Validating Phase {phase} before proceeding...")
+    logger.info("Validating Phase %d before proceeding...", phase)
+
+    # In non-strict mode only the critical checks matter, so skip the rest
+    checks = None if strict else CRITICAL_CHECKS.get(phase)
 
     try:
         if phase == 3:
-            report = validate_clip_division(session_id)
+            validator_func = validate_clip_division
         elif phase == 4:
-            report = validate_phase4_strategies(session_id)
+            validator_func = validate_phase4_strategies
         else:
-            logger.warning(f"No validator available for Phase {phase}")
+            logger.warning("No validator available for Phase %d", phase)
             return True
 
+        # Reuse a full report from earlier in the pipeline if still current
+        report = _get_cached_report(session_id, phase)
+
+        if report is None:
+            cache_key = _report_cache_key(session_id, phase)
+            report = validator_func(session_id, checks=checks)
+            if checks is None:
+                _cache_report(session_id, phase, cache_key, report)
+        else:
+            logger.info("Using cached Phase %d validation report", phase)
+
         # Check validation status
         if report['summary']['overall_status'] == 'PASS':
-            logger.info(f"Phase {phase} validation passed")
+            logger.info("Phase %d validation passed", phase)
             return True
 
         # In strict mode, fail on any validation error
         if strict:
-            logger.error(f"Phase {phase} validation failed (strict mode)")
+            logger.error("Phase %d validation failed (strict mode)", phase)
             return False
 
         # In non-strict mode, allow warnings but check for critical failures
         failed_checks = report['summary']['failed_checks']
+        critical_failures = [
+            check_name for check_name in CRITICAL_CHECKS.get(phase, ())
+            if not report['validation_results'].get(check_name, _EMPTY_RESULT).get('passed', True)
+        ]
 
-        # Define critical checks that must pass
-        critical_checks = {
-            3: ['clip_id_uniqueness', 'timing_consistency'],
-            4: ['strategy_completeness', 'generation_mode_validity']
-        }
-
-        if phase in critical_checks:
-            for check_name in critical_checks[phase]:
-                check_result = report['validation_results'].get(check_name, {})
-                if not check_result.get('passed', True):
-                    logger.error(f"Critical check failed: {check_name}")
-                    return False
+        if critical_failures:
+            logger.error("Critical checks failed: %s", ", ".join(critical_failures))
+            return False
 
-        # Non-critical failures - log warning but allow to continue
+        # Non-critical failures (only present in a cached full report) -
+        # log warning but allow to continue
         logger.warning(
-            f"Phase {phase} has {failed_checks} failed checks, "
-            "but no critical failures detected"
+            "Phase %d has %d failed checks, but no critical failures detected",
+            phase, failed_checks
         )
         return True
 
     except Exception as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         # In strict mode, fail on validation errors
         return not strict
 
 
+def validate_sessions_parallel(
+    session_ids: List[str],
+    phase: int,
+    strict: bool = False,
+    max_workers: int = 8
+) -> Dict[str, bool]:
+    """
+    Run validate_before_next_phase for several sessions concurrently.
+
+    Validation is dominated by reading and parsing session files, so
+    threads overlap that I/O. Console output from the validators may
+    interleave between sessions.
+
+    Args:
+        session_ids: Session identifiers to validate
+        phase: Phase number to validate
+        strict: Passed through to validate_before_next_phase
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        Dictionary mapping session ID to whether it may proceed (False for
+        sessions whose validation aborted, e.g. a missing session)
+    """
+    def gate(session_id: str) -> bool:
+        # The validators sys.exit() on a missing session or empty phase
+        # data; fail that session only instead of the whole batch
+        try:
+            return validate_before_next_phase(session_id, phase, strict=strict)
+        except SystemExit:
+            logger.error("Phase %d validation aborted for session %s", phase, session_id)
+            return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(gate, session_ids)
+        return dict(zip(session_ids, results))
+
+
 def example_usage():
     """Example usage of validators."""
     # Example 1: Validate a specific session
@@ -197,6 +297,10 @@ def example_usage():
     print("\n=== Example 3: Run Phase with Auto-Validation ===")
     # run_orchestration_with_validation(session_id)
 
+    # Example 4: Gate several sessions at once
+    print("\n=== Example 4: Validate Multiple Sessions ===")
+    # results = validate_sessions_parallel([session_id, other_session_id], phase=3)
+
 
 if __name__ == "__main__":
     example_usage()
@@ -7,129 +7,136 @@ Tests validation functionality for clip division output including:
 - Edge cases are handled properly
 """
 
-import pytest
-import sys
-from pathlib import Path
+import importlib
+import random
+import shutil
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import pytest
 
 from tools.validators.validation_utils import (
     validate_unique_ids,
     validate_timing_consistency,
     validate_timeline_coverage,
-    validate_duration_sanity
+    validate_duration_sanity,
+    get_session_cache_key,
+    extract_clips_from_phase3,
+    ClipTable
 )
 from tools.validators.validate_clip_division import (
     validate_section_coverage,
     validate_beat_alignment,
     validate_base_allocation,
-    validate_creative_adjustments
+    validate_creative_adjustments,
+    _nearest_beat_distance,
+    CHECKS,
+    SAMPLED_CHECKS,
+    validate_clip_division
 )
+from tools.validators import integration_example
+from tools.validators.integration_example import (
+    CRITICAL_CHECKS,
+    validate_before_next_phase,
+    validate_sessions_parallel
+)
+
+
+# Shared clip lists, built once per module. Tuples so tests can't mutate them.
+@pytest.fixture(scope="module")
+def three_unique_clips():
+    """Three clips with distinct IDs."""
+    return (
+        {'clip_id': 'clip_001'},
+        {'clip_id': 'clip_002'},
+        {'clip_id': 'clip_003'}
+    )
+
+
+@pytest.fixture(scope="module")
+def two_time_ordered_clips():
+    """Two back-to-back clips with consistent timing."""
+    return (
+        {'clip_id': 'clip_001', 'start_time': 0.0, 'end_time': 3.0, 'duration': 3.0},
+        {'clip_id': 'clip_002', 'start_time': 3.0, 'end_time': 6.0, 'duration': 3.0}
+    )
+
+
+@pytest.fixture(scope="module")
+def covered_timeline_clips():
+    """Three clips covering 0-10s without gaps or overlaps."""
+    return (
+        {'clip_id': 'clip_001', 'start_time': 0.0, 'end_time': 3.0},
+        {'clip_id': 'clip_002', 'start_time': 3.0, 'end_time': 6.0},
+        {'clip_id': 'clip_003', 'start_time': 6.0, 'end_time': 10.0}
+    )
 
 
 class TestClipIDUniqueness:
     """Test clip ID uniqueness validation."""
 
-    def test_unique_ids_pass(self):
+    def test_unique_ids_pass(self, three_unique_clips):
         """Test that unique IDs pass validation."""
-        clips = [
-            {'clip_id': 'clip_001'},
-            {'clip_id': 'clip_002'},
-            {'clip_id': 'clip_003'}
-        ]
-        result = validate_unique_ids(clips, 'clip_id')
+        result = validate_unique_ids(three_unique_clips, 'clip_id')
         assert result['passed'] is True
         assert len(result['duplicate_ids']) == 0
 
-    def test_duplicate_ids_fail(self):
+    @pytest.mark.parametrize("ids,duplicate_ids", [
+        (['clip_001', 'clip_002', 'clip_001'], ['clip_001']),
+        (['clip_001', 'clip_001', 'clip_001'], ['clip_001', 'clip_001']),
+    ])
+    def test_duplicate_ids_fail(self, ids, duplicate_ids):
         """Test that duplicate IDs are detected."""
-        clips = [
-            {'clip_id': 'clip_001'},
-            {'clip_id': 'clip_002'},
-            {'clip_id': 'clip_001'}  # Duplicate
-        ]
+        clips = [{'clip_id': clip_id} for clip_id in ids]
         result = validate_unique_ids(clips, 'clip_id')
         assert result['passed'] is False
-        assert 'clip_001' in result['duplicate_ids']
+        assert result['duplicate_ids'] == duplicate_ids
+
+    @pytest.mark.parametrize("clips", [
+        pytest.param([{'clip_id': None}, {'clip_id': None}], id="null-ids"),
+        pytest.param([{}, {}, {'clip_id': 'clip_001'}], id="missing-ids"),
+    ])
+    def test_clip_table_matches_list(self, clips):
+        """Test that a ClipTable gives the same result as the clip list."""
+        assert validate_unique_ids(ClipTable.from_clips(clips)) == validate_unique_ids(clips)
+
+    def test_clip_table_rejects_other_id_key(self):
+        """Test that a ClipTable can only be checked for clip IDs."""
+        with pytest.raises(ValueError):
+            validate_unique_ids(ClipTable.from_clips([{'clip_id': 'clip_001'}]), 'section_id')
 
 
 class TestTimingConsistency:
     """Test timing consistency validation."""
 
-    def test_valid_timing_pass(self):
+    def test_valid_timing_pass(self, two_time_ordered_clips):
         """Test that valid timing passes."""
-        clips = [
-            {
-                'clip_id': 'clip_001',
-                'start_time': 0.0,
-                'end_time': 3.0,
-                'duration': 3.0
-            },
-            {
-                'clip_id': 'clip_002',
-                'start_time': 3.0,
-                'end_time': 6.0,
-                'duration': 3.0
-            }
-        ]
-        result = validate_timing_consistency(clips)
+        result = validate_timing_consistency(two_time_ordered_clips)
         assert result['passed'] is True
         assert len(result['issues']) == 0
 
-    def test_start_after_end_fail(self):
-        """Test that start >= end is detected."""
-        clips = [
-            {
-                'clip_id': 'clip_001',
-                'start_time': 5.0,
-                'end_time': 3.0,  # Invalid
-                'duration': -2.0
-            }
-        ]
-        result = validate_timing_consistency(clips)
-        assert result['passed'] is False
-        assert len(result['issues']) > 0
-
-    def test_duration_mismatch_fail(self):
-        """Test that duration mismatch is detected."""
-        clips = [
-            {
-                'clip_id': 'clip_001',
-                'start_time': 0.0,
-                'end_time': 3.0,
-                'duration': 5.0  # Should be 3.0
-            }
-        ]
-        result = validate_timing_consistency(clips)
-        assert result['passed'] is False
-        assert any('duration mismatch' in issue.lower() for issue in result['issues'])
-
-    def test_negative_timing_fail(self):
-        """Test that negative times are detected."""
-        clips = [
-            {
-                'clip_id': 'clip_001',
-                'start_time': -1.0,  # Invalid
-                'end_time': 3.0,
-                'duration': 4.0
-            }
-        ]
+    @pytest.mark.parametrize("start_time,end_time,duration,expected_issue", [
+        (5.0, 3.0, -2.0, 'start_time'),  # start >= end
+        (0.0, 3.0, 5.0, 'duration mismatch'),  # Should be 3.0
+        (-1.0, 3.0, 4.0, 'negative'),  # Negative start
+    ], ids=['start_after_end', 'duration_mismatch', 'negative_timing'])
+    def test_invalid_timing_fail(self, start_time, end_time, duration, expected_issue):
+        """Test that inconsistent timing is detected."""
+        clips = [{
+            'clip_id': 'clip_001',
+            'start_time': start_time,
+            'end_time': end_time,
+            'duration': duration
+        }]
         result = validate_timing_consistency(clips)
         assert result['passed'] is False
+        assert any(expected_issue in issue.lower() for issue in result['issues'])
 
 
 class TestTimelineCoverage:
     """Test timeline coverage validation."""
 
-    def test_full_coverage_pass(self):
+    def test_full_coverage_pass(self, covered_timeline_clips):
         """Test that full coverage passes."""
-        clips = [
-            {'clip_id': 'clip_001', 'start_time': 0.0, 'end_time': 3.0},
-            {'clip_id': 'clip_002', 'start_time': 3.0, 'end_time': 6.0},
-            {'clip_id': 'clip_003', 'start_time': 6.0, 'end_time': 10.0}
-        ]
-        result = validate_timeline_coverage(clips, total_duration=10.0)
+        result = validate_timeline_coverage(covered_timeline_clips, total_duration=10.0)
         assert result['passed'] is True
         assert len(result['gaps']) == 0
         assert len(result['overlaps']) == 0
@@ -218,6 +225,17 @@ class TestBeatAlignment:
         # This clip claims to be beat aligned but isn't
         assert 'clip_001' in result.get('misaligned_clips', [])
 
+    def test_misaligned_examples_bounded(self):
+        """Test that misaligned clips are counted in full but listed up to 5."""
+        clips = [
+            {'clip_id': f'clip_{i:03d}', 'start_time': i + 0.5, 'end_time': i + 1.5, 'beat_aligned': True}
+            for i in range(7)
+        ]
+        beat_times = [float(i) for i in range(10)]
+        result = validate_beat_alignment(clips, beat_times, tolerance=0.1)
+        assert result['misaligned_total'] == 7
+        assert result['misaligned_clips'] == [f'clip_{i:03d}' for i in range(5)]
+
     def test_no_beat_data(self):
         """Test behavior when no beat data is available."""
         clips = [
@@ -226,6 +244,29 @@ class TestBeatAlignment:
         result = validate_beat_alignment(clips, beat_times=None)
         assert result['passed'] is True  # Should pass with warning
 
+    @pytest.mark.parametrize("time,expected", [
+        (-1.0, 1.0),  # Before the first beat
+        (0.0, 0.0),  # Exactly on a beat
+        (1.4, 0.4),  # Nearer the lower neighbour
+        (1.6, 0.4),  # Nearer the upper neighbour
+        (5.0, 1.0),  # After the last beat
+    ])
+    def test_nearest_beat_distance(self, time, expected):
+        """Test nearest-beat lookup at the edges of the beat list."""
+        assert _nearest_beat_distance([0.0, 1.0, 2.0, 3.0, 4.0], time) == pytest.approx(expected)
+
+    def test_nearest_beat_distance_no_beats(self):
+        """Test that there is no nearest beat in an empty beat list."""
+        assert _nearest_beat_distance([], 1.0) == float('inf')
+
+    def test_nearest_beat_distance_matches_linear_scan(self):
+        """Test the bisect lookup against a full scan on random beats."""
+        rng = random.Random(0)
+        for _ in range(200):
+            beats = sorted(rng.uniform(0, 60) for _ in range(rng.randint(1, 50)))
+            time = rng.uniform(-5, 65)
+            assert _nearest_beat_distance(beats, time) == min(abs(time - beat) for beat in beats)
+
 
 class TestBaseAllocation:
     """Test base allocation validation."""
@@ -313,5 +354,225 @@ class TestDurationSanity:
         assert result['avg_duration'] == 3.0
 
 
+class TestCheckSelection:
+    """Test running a subset of checks."""
+
+    def test_critical_checks_registered(self):
+        """Test that the non-strict gate only requests known checks."""
+        names = [name for name, _, _ in CHECKS]
+        assert set(CRITICAL_CHECKS[3]) <= set(names)
+
+    def test_unknown_check_rejected(self):
+        """Test that unknown check names fail before loading the session."""
+        with pytest.raises(ValueError):
+            validate_clip_division('nonexistent_session', checks=['no_such_check'])
+
+    def test_invalid_sample_rejected(self):
+        """Test that an empty clip sample fails before loading the session."""
+        with pytest.raises(ValueError):
+            validate_clip_division('nonexistent_session', sample=0)
+
+    def test_parallel_gate_missing_session(self):
+        """Test that a missing session fails its own gate, not the whole batch."""
+        results = validate_sessions_parallel(['nonexistent_session', 'other_missing_session'], 3)
+        assert results == {'nonexistent_session': False, 'other_missing_session': False}
+
+
+class TestSessionMtime:
+    """Test the session cache key."""
+
+    @pytest.fixture
+    def session(self):
+        """A saved session with valid Phase 3 data, removed afterwards."""
+        from core import SharedState
+        from core.utils import get_session_dir
+
+        state = SharedState.create_session()
+        clips = [
+            {'clip_id': f'clip_{i:03d}', 'start_time': i * 4.0, 'end_time': i * 4.0 + 4.0,
+             'duration': 4.0, 'base_allocation': {}}
+            for i in range(5)
+        ]
+        state.set_phase_data(3, {'winner': {'proposal': {'clips': clips}}})
+        integration_example._REPORT_CACHE.clear()
+        yield state
+        integration_example._REPORT_CACHE.clear()
+        shutil.rmtree(get_session_dir(state.session_id))
+
+    def test_missing_session(self):
+        """Test that a missing session has no cache key."""
+        assert get_session_cache_key('nonexistent_session') is None
+
+    @pytest.fixture
+    def validator_calls(self, monkeypatch):
+        """Record each session the gate actually runs the validator for."""
+        calls = []
+
+        def counting_validator(session_id, **kwargs):
+            calls.append(session_id)
+            return validate_clip_division(session_id, **kwargs)
+
+        monkeypatch.setattr(integration_example, 'validate_clip_division', counting_validator)
+        return calls
+
+    def test_cache_hit(self, session, validator_calls):
+        """Test that an unchanged session reuses its cached full report."""
+        validate_before_next_phase(session.session_id, 3, strict=True)
+        validate_before_next_phase(session.session_id, 3, strict=True)
+        assert validator_calls == [session.session_id]
+        assert (session.session_id, 3) in integration_example._REPORT_CACHE
+
+    def test_cache_miss_after_save(self, session, validator_calls):
+        """Test that saving the session invalidates the cached report."""
+        validate_before_next_phase(session.session_id, 3, strict=True)
+        key = get_session_cache_key(session.session_id)
+
+        # Add a clip; the size changes even if the mtime tick doesn't
+        clips = session.get_phase_data(3).data['winner']['proposal']['clips']
+        clips.append(dict(clips[0], clip_id='clip_005'))
+        session.set_phase_data(3, {'winner': {'proposal': {'clips': clips}}})
+
+        assert get_session_cache_key(session.session_id) != key
+        validate_before_next_phase(session.session_id, 3, strict=True)
+        assert validator_calls == [session.session_id] * 2
+
+    def test_cache_miss_after_analysis_rebuild(self, session, validator_calls, tmp_path, monkeypatch):
+        """Test that rebuilding analysis.json invalidates the cached Phase 3 report."""
+        module = importlib.import_module('tools.validators.validate_clip_division')
+        analysis_path = tmp_path / "analysis.json"
+        analysis_path.write_text('{"beats": []}')
+        monkeypatch.setattr(module, '_analysis_path', lambda: analysis_path)
+
+        validate_before_next_phase(session.session_id, 3, strict=True)
+        analysis_path.write_text('{"beats": [{"time": 0.0}]}')
+        validate_before_next_phase(session.session_id, 3, strict=True)
+        assert validator_calls == [session.session_id] * 2
+
+    def test_check_subset_not_cached_or_saved(self, session, validator_calls):
+        """Test that a non-strict (critical checks only) run leaves no report behind."""
+        from core.utils import get_session_dir
+
+        assert validate_before_next_phase(session.session_id, 3, strict=False)
+        validate_before_next_phase(session.session_id, 3, strict=False)
+        assert validator_calls == [session.session_id] * 2
+        assert (session.session_id, 3) not in integration_example._REPORT_CACHE
+        assert not (get_session_dir(session.session_id) / "validation_clip_division.json").exists()
+
+
+class TestPhase3Extraction:
+    """Test extracting clips from Phase 3 data."""
+
+    @pytest.mark.parametrize("proposal", [
+        pytest.param({'sections': [
+            {'section_name': 'intro', 'clips': [{'clip_id': 'clip_001', 'start_time': 0.0}]},
+            {'section_name': 'verse', 'clips': [{'clip_id': 'clip_002', 'start_time': 4.0}]},
+        ]}, id="sections"),
+        pytest.param({'clips': [
+            {'clip_id': 'clip_001', 'section': 'intro'},
+            {'clip_id': 'clip_002'},
+        ]}, id="flat"),
+    ])
+    def test_table_matches_extracted_clips(self, proposal):
+        """Test that ClipTable.from_phase3 matches building from extracted clips."""
+        phase3_data = {'winner': {'proposal': proposal}}
+        expected = ClipTable.from_clips(extract_clips_from_phase3(phase3_data))
+        assert ClipTable.from_phase3(phase3_data) == expected
+
+    def test_sections_not_mutated(self):
+        """Test that extraction leaves the Phase 3 clips untouched."""
+        clip = {'clip_id': 'clip_001'}
+        phase3_data = {'winner': {'proposal': {'sections': [{'section_name': 'intro', 'clips': [clip]}]}}}
+        assert extract_clips_from_phase3(phase3_data)[0]['section'] == 'intro'
+        assert ClipTable.from_phase3(phase3_data).sections == ['intro']
+        assert 'section' not in clip
+
+
+class TestClipTable:
+    """Test the column-oriented clip view."""
+
+    def test_take(self):
+        """Test that take keeps only the selected clips, in order."""
+        table = ClipTable.from_clips([
+            {'clip_id': f'clip_{i:03d}', 'start_time': float(i), 'base_allocation': 1.0}
+            for i in range(5)
+        ])
+        subset = table.take([3, 1])
+        assert subset.ids == ['clip_003', 'clip_001']
+        assert subset.starts == [3.0, 1.0]
+        assert subset.has_base_allocation == [True, True]
+        assert len(table) == 5
+
+
+class TestSampledValidation:
+    """Test validating the per-clip checks on a clip sample."""
+
+    @pytest.fixture
+    def saved_reports(self, monkeypatch):
+        """Reports the validator saves, recorded instead of written."""
+        # The package re-exports the function under the module's name
+        module = importlib.import_module('tools.validators.validate_clip_division')
+        saved = []
+        monkeypatch.setattr(module, '_write_report', lambda report_path, report: saved.append(report))
+        return saved
+
+    @pytest.fixture
+    def seen_sizes(self, monkeypatch, saved_reports):
+        """Run against 20 in-memory clips, recording how many clips each check sees."""
+        module = importlib.import_module('tools.validators.validate_clip_division')
+        # Every clip is too short, so duration_sanity warns once per clip it checks
+        clips = ClipTable.from_clips([
+            {'clip_id': f'clip_{i:03d}', 'start_time': i * 4.0, 'end_time': i * 4.0 + 0.2,
+             'duration': 0.2, 'base_allocation': {}}
+            for i in range(20)
+        ])
+        monkeypatch.setattr(module, 'get_session_cache_key', lambda session_id: (0, 0))
+        monkeypatch.setattr(module, '_load_session_artifacts',
+                            lambda session_id, cache_key: ('completed', clips))
+
+        sizes = {}
+
+        def recording(name, check):
+            def wrapper(clips, metadata, beat_times):
+                sizes[name] = len(clips)
+                return check(clips, metadata, beat_times)
+            return wrapper
+
+        monkeypatch.setattr(module, 'CHECKS', [
+            (name, display_name, recording(name, check))
+            for name, display_name, check in CHECKS
+        ])
+        return sizes
+
+    def test_sample(self, seen_sizes, saved_reports):
+        """Test that only the sampled checks see the sample and nothing is saved."""
+        report = validate_clip_division('sampled_session', sample=5, seed=0)
+        assert report['sampled'] is True
+        assert report['sample_size'] == 5
+        assert report['population_size'] == 20
+        assert {name for name, size in seen_sizes.items() if size == 5} == SAMPLED_CHECKS
+        assert all(size == 20 for name, size in seen_sizes.items() if name not in SAMPLED_CHECKS)
+        assert saved_reports == []
+
+    def test_sample_does_less_work(self, seen_sizes, saved_reports):
+        """Test that a sampled run checks fewer clips than a full run."""
+        full = validate_clip_division('sampled_session')
+        full_work = sum(seen_sizes.values())
+        sampled = validate_clip_division('sampled_session', sample=5, seed=0)
+        sampled_work = sum(seen_sizes.values())
+
+        assert sampled_work == full_work - len(SAMPLED_CHECKS) * 15
+        assert len(full['validation_results']['duration_sanity']['warnings']) == 20
+        assert len(sampled['validation_results']['duration_sanity']['warnings']) == 5
+        assert saved_reports == [full]
+
+    def test_sample_larger_than_population(self, seen_sizes, saved_reports):
+        """Test that a sample covering every clip checks them all."""
+        report = validate_clip_division('sampled_session', sample=50, seed=0)
+        assert report['sampled'] is False
+        assert report['sample_size'] == 20
+        assert set(seen_sizes.values()) == {20}
+        assert saved_reports == []
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -13,20 +13,30 @@ This validator checks:
 - Duration sanity
 
 Usage:
-    python3 tools/validators/validate_clip_division.py <session_id>
+    python3 tools/validators/validate_clip_division.py <session_id> [--sample N [--seed S]]
 """
 
 import sys
 import argparse
+import random
+import bisect
+import functools
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from core import SharedState
-from core.utils import read_json, write_json, get_session_dir, get_iso_timestamp, get_project_root
+from core.utils import read_json_cached, write_json, get_session_dir, get_iso_timestamp, get_project_root
 from tools.validators.validation_utils import (
+    ClipTable,
+    as_clip_table,
     print_header,
     print_check,
     print_summary,
@@ -34,53 +44,55 @@ from tools.validators.validation_utils import (
     validate_timing_consistency,
     validate_timeline_coverage,
     validate_duration_sanity,
-    load_analysis_metadata,
-    extract_clips_from_phase3,
+    extract_analysis_metadata,
+    get_file_cache_key,
+    get_session_cache_key,
     build_validation_summary
 )
 
 
 def validate_section_coverage(
-    clips: List[Dict[str, Any]],
+    clips: Union[List[Dict[str, Any]], ClipTable],
     analysis_sections: List[str]
 ) -> Dict[str, Any]:
     """
     Validate that all clips are assigned to valid sections.
 
     Args:
-        clips: List of clip dictionaries
+        clips: List of clip dictionaries or a ClipTable
         analysis_sections: Valid section names from analysis.json
 
     Returns:
         Validation result dictionary
     """
+    table = as_clip_table(clips)
+    sections = table.sections
     unassigned_clips = []
     invalid_sections = []
 
     # If no sections provided in analysis, accept any section assignment
     if not analysis_sections:
-        for clip in clips:
-            if 'section' not in clip or not clip['section']:
-                unassigned_clips.append(clip.get('clip_id', 'unknown'))
+        if not all(sections):
+            unassigned_clips = [table.clip_id(i) for i, section in enumerate(sections) if not section]
     else:
-        # Validate against known sections
-        valid_section_names = set(s.get('name', s.get('section_name', '')) for s in analysis_sections if isinstance(s, dict))
-
-        # If sections are just strings
-        if analysis_sections and isinstance(analysis_sections[0], str):
-            valid_section_names = set(analysis_sections)
-
-        for clip in clips:
-            clip_id = clip.get('clip_id', 'unknown')
-            section = clip.get('section', '')
-
-            if not section:
-                unassigned_clips.append(clip_id)
-            elif section not in valid_section_names:
-                invalid_sections.append({
-                    'clip_id': clip_id,
-                    'section': section
-                })
+        # Validate against known sections (names, or section dicts)
+        if isinstance(analysis_sections[0], str):
+            valid_section_names = frozenset(analysis_sections)
+        else:
+            valid_section_names = frozenset(
+                s.get('name', s.get('section_name', '')) for s in analysis_sections if isinstance(s, dict)
+            )
+
+        # Only walk the clips if some section is missing or unknown
+        if not (all(sections) and valid_section_names.issuperset(sections)):
+            for i, section in enumerate(sections):
+                if not section:
+                    unassigned_clips.append(table.clip_id(i))
+                elif section not in valid_section_names:
+                    invalid_sections.append({
+                        'clip_id': table.clip_id(i),
+                        'section': section
+                    })
 
     passed = len(unassigned_clips) == 0 and len(invalid_sections) == 0
 
@@ -101,8 +113,24 @@ def validate_section_coverage(
     }
 
 
+def _nearest_beat_distance(beats: List[float], time: float) -> float:
+    """
+    Get the distance from a time to the nearest beat.
+
+    Args:
+        beats: Beat timestamps, sorted ascending
+        time: Time to look up
+
+    Returns:
+        Distance in seconds (inf if there are no beats)
+    """
+    index = bisect.bisect_left(beats, time)
+    neighbours = beats[max(index - 1, 0):index + 1]
+    return min((abs(time - beat) for beat in neighbours), default=float('inf'))
+
+
 def validate_beat_alignment(
-    clips: List[Dict[str, Any]],
+    clips: Union[List[Dict[str, Any]], ClipTable],
     beat_times: Optional[List[float]] = None,
     tolerance: float = 0.3
 ) -> Dict[str, Any]:
@@ -110,7 +138,7 @@ def validate_beat_alignment(
     Check if clips align to beat boundaries.
 
     Args:
-        clips: List of clip dictionaries
+        clips: List of clip dictionaries or a ClipTable
         beat_times: List of beat timestamps (if available)
         tolerance: Alignment tolerance in seconds
 
@@ -123,26 +151,26 @@ def validate_beat_alignment(
             "passed": True,
             "alignment_percentage": 0.0,
             "misaligned_clips": [],
+            "misaligned_total": 0,
             "message": "No beat data available for alignment check"
         }
 
+    table = as_clip_table(clips)
+    beats = sorted(beat_times)
     aligned_count = 0
-    misaligned_clips = []
+    misaligned_clips = []  # First 5 only
+    misaligned_total = 0
 
-    for clip in clips:
-        clip_id = clip.get('clip_id', 'unknown')
-        start_time = clip.get('start_time', 0)
-        end_time = clip.get('end_time', 0)
+    for i in range(len(table)):
+        start_time = table.starts[i]
+        end_time = table.ends[i]
 
         # Check if marked as beat aligned
-        is_beat_aligned = clip.get('beat_aligned', False)
+        is_beat_aligned = table.beat_aligned[i]
 
         # Find nearest beats
-        start_distances = [abs(start_time - beat) for beat in beat_times]
-        end_distances = [abs(end_time - beat) for beat in beat_times]
-
-        min_start_dist = min(start_distances) if start_distances else float('inf')
-        min_end_dist = min(end_distances) if end_distances else float('inf')
+        min_start_dist = _nearest_beat_distance(beats, start_time)
+        min_end_dist = _nearest_beat_distance(beats, end_time)
 
         # Check alignment
         start_aligned = min_start_dist <= tolerance
@@ -153,9 +181,11 @@ def validate_beat_alignment(
         else:
             # Flag if marked as aligned but actually isn't
             if is_beat_aligned:
-                misaligned_clips.append(clip_id)
+                misaligned_total += 1
+                if len(misaligned_clips) < 5:
+                    misaligned_clips.append(table.clip_id(i))
 
-    alignment_percentage = (aligned_count / len(clips) * 100) if clips else 0
+    alignment_percentage = (aligned_count / len(table) * 100) if len(table) else 0
 
     # Pass if most clips are aligned (>90%)
     passed = alignment_percentage >= 90.0
@@ -163,29 +193,25 @@ def validate_beat_alignment(
     return {
         "passed": passed,
         "alignment_percentage": round(alignment_percentage, 1),
-        "misaligned_clips": misaligned_clips[:5],  # Limit to first 5
+        "misaligned_clips": misaligned_clips,
+        "misaligned_total": misaligned_total,
         "message": f"{alignment_percentage:.0f}% of clips aligned to beats"
     }
 
 
-def validate_base_allocation(clips: List[Dict[str, Any]]) -> Dict[str, Any]:
+def validate_base_allocation(clips: Union[List[Dict[str, Any]], ClipTable]) -> Dict[str, Any]:
     """
     Verify base_allocation exists for clips.
 
     Args:
-        clips: List of clip dictionaries
+        clips: List of clip dictionaries or a ClipTable
 
     Returns:
         Validation result dictionary
     """
-    clips_with_allocation = 0
-    clips_without_allocation = 0
-
-    for clip in clips:
-        if 'base_allocation' in clip:
-            clips_with_allocation += 1
-        else:
-            clips_without_allocation += 1
+    table = as_clip_table(clips)
+    clips_with_allocation = sum(table.has_base_allocation)
+    clips_without_allocation = len(table) - clips_with_allocation
 
     passed = clips_without_allocation == 0
 
@@ -197,21 +223,17 @@ def validate_base_allocation(clips: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def validate_creative_adjustments(clips: List[Dict[str, Any]]) -> Dict[str, Any]:
+def validate_creative_adjustments(clips: Union[List[Dict[str, Any]], ClipTable]) -> Dict[str, Any]:
     """
     Verify creative_adjustments structure where present.
 
     Args:
-        clips: List of clip dictionaries
+        clips: List of clip dictionaries or a ClipTable
 
     Returns:
         Validation result dictionary
     """
-    clips_with_adjustments = 0
-
-    for clip in clips:
-        if 'creative_adjustments' in clip:
-            clips_with_adjustments += 1
+    clips_with_adjustments = sum(as_clip_table(clips).has_creative_adjustments)
 
     # Creative adjustments are optional, so this always passes
     passed = True
@@ -223,34 +245,148 @@ def validate_creative_adjustments(clips: List[Dict[str, Any]]) -> Dict[str, Any]
     }
 
 
-def validate_clip_division(session_id: str) -> Dict[str, Any]:
+@functools.lru_cache(maxsize=32)
+def _load_session_artifacts(session_id: str, cache_key: Tuple[int, int]) -> Tuple[str, ClipTable]:
+    """
+    Load Phase 3 status and clips from a session.
+
+    Cached per (session_id, state.json mtime and size), so repeated validations of an
+    unchanged session skip re-reading and re-parsing state.json, and every
+    check shares one ClipTable. The returned table must not be modified.
+
+    Args:
+        session_id: Session identifier
+        cache_key: state.json cache key (see get_session_cache_key)
+
+    Returns:
+        Tuple of (Phase 3 status, ClipTable of the clips)
+    """
+    session = SharedState.load_session(session_id)
+    phase3_data = session.get_phase_data(3)
+    return phase3_data.status, ClipTable.from_phase3(phase3_data.data)
+
+
+def _analysis_path() -> Path:
+    """Get the path of the song analysis read by the ANALYSIS_CHECKS."""
+    return get_project_root() / "shared-workspace" / "input" / "analysis.json"
+
+
+def get_report_cache_key(session_id: str) -> Optional[Tuple[Any, ...]]:
+    """
+    Get a cache key for everything a full clip division report is built from.
+
+    Combines the state.json and analysis.json cache keys, so saving the
+    session or rebuilding the analysis both change it.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        Tuple of the state.json and analysis.json cache keys (the latter
+        None if analysis.json is missing), or None if the session doesn't exist
+    """
+    session_key = get_session_cache_key(session_id)
+    if session_key is None:
+        return None
+    return session_key, get_file_cache_key(_analysis_path())
+
+
+def _write_report(report_path: Path, report: Dict[str, Any]) -> None:
+    """
+    Write the validation report, with orjson when it is installed.
+
+    json.dump falls back to its pure-Python encoder whenever indent is set,
+    which dominates the cost of saving a report for a long clip list. Only
+    this report uses orjson; other files keep write_json's stdlib output.
+    """
+    if orjson is None:
+        write_json(str(report_path), report)
+        return
+
+    report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+
+
+# Checks in run order: (result key, display name, check function).
+# Check functions take (clips as a ClipTable, metadata, beat_times); cheap
+# checks come first.
+CHECKS = [
+    ('clip_id_uniqueness', "Clip ID Uniqueness",
+     lambda clips, metadata, beat_times: validate_unique_ids(clips, 'clip_id')),
+    ('timing_consistency', "Timing Consistency",
+     lambda clips, metadata, beat_times: validate_timing_consistency(clips)),
+    ('section_coverage', "Section Coverage",
+     lambda clips, metadata, beat_times: validate_section_coverage(clips, metadata.get('sections', []))),
+    ('timeline_coverage', "Timeline Coverage",
+     lambda clips, metadata, beat_times: validate_timeline_coverage(clips, metadata.get('duration', 180.0))),
+    ('beat_alignment', "Beat Alignment",
+     lambda clips, metadata, beat_times: validate_beat_alignment(clips, beat_times)),
+    ('base_allocation', "Base Allocation",
+     lambda clips, metadata, beat_times: validate_base_allocation(clips)),
+    ('creative_adjustments', "Creative Adjustments",
+     lambda clips, metadata, beat_times: validate_creative_adjustments(clips)),
+    ('duration_sanity', "Duration Sanity",
+     lambda clips, metadata, beat_times: validate_duration_sanity(clips)),
+]
+
+# Checks that read analysis.json (metadata or beat times)
+ANALYSIS_CHECKS = {'section_coverage', 'timeline_coverage', 'beat_alignment'}
+
+# Checks that run on the clip sample in a sampled validation: the per-clip
+# checks, whose cost grows with the number of clips checked. Uniqueness and
+# coverage need every clip, so they always see the full clip list.
+SAMPLED_CHECKS = {
+    'timing_consistency', 'beat_alignment', 'base_allocation',
+    'creative_adjustments', 'duration_sanity'
+}
+
+
+def validate_clip_division(
+    session_id: str,
+    checks: Optional[Iterable[str]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Main validation function for Phase 3 clip division.
 
     Args:
         session_id: Session identifier
+        checks: Names of the checks to run (see CHECKS). Runs all checks and
+            saves the report to the session directory if None; a partial
+            run is not saved.
+        sample: If set, run the SAMPLED_CHECKS on a random sample of this
+            many clips instead of all of them. A sampled run is not saved.
+        seed: Random seed for the clip sample
 
     Returns:
         Complete validation results dictionary
+
+    Raises:
+        ValueError: If an unknown check name is requested, or sample is
+            less than 1
     """
+    if checks is not None:
+        checks = set(checks)
+        unknown = checks.difference(name for name, _, _ in CHECKS)
+        if unknown:
+            raise ValueError(f"Unknown Phase 3 checks: {sorted(unknown)}")
+
+    if sample is not None and sample < 1:
+        raise ValueError(f"Sample size must be at least 1, got {sample}")
+
     # Print header
     print_header("=== MV Orchestra v2.8 - Phase 3 Clip Division Validation ===", session_id)
 
-    # Load session
-    try:
-        session = SharedState.load_session(session_id)
-    except FileNotFoundError:
+    # Load session (Phase 3 status and clips)
+    cache_key = get_session_cache_key(session_id)
+    if cache_key is None:
         print(f"Error: Session '{session_id}' not found")
         sys.exit(1)
 
-    # Get Phase 3 data
-    phase3_data = session.get_phase_data(3)
-
-    if phase3_data.status != "completed":
-        print(f"Warning: Phase 3 status is '{phase3_data.status}', not 'completed'")
+    phase3_status, clips = _load_session_artifacts(session_id, cache_key)
 
-    # Extract clips
-    clips = extract_clips_from_phase3(phase3_data.data)
+    if phase3_status != "completed":
+        print(f"Warning: Phase 3 status is '{phase3_status}', not 'completed'")
 
     if not clips:
         print("Error: No clips found in Phase 3 data")
@@ -258,55 +394,38 @@ def validate_clip_division(session_id: str) -> Dict[str, Any]:
 
     print(f"Total Clips: {len(clips)}\n")
 
-    # Load analysis metadata
-    project_root = get_project_root()
-    analysis_path = project_root / "shared-workspace" / "input" / "analysis.json"
-
-    if analysis_path.exists():
-        analysis = read_json(str(analysis_path))
-        metadata = load_analysis_metadata(analysis_path)
-        beat_times = analysis.get('beats', [])
-    else:
-        print("Warning: analysis.json not found, using defaults")
-        metadata = {'duration': 180.0, 'bpm': 120, 'sections': []}
-        beat_times = []
+    # Draw the clip sample (kept in timeline order)
+    sampled_clips = clips
+    if sample is not None and sample < len(clips):
+        indices = sorted(random.Random(seed).sample(range(len(clips)), sample))
+        sampled_clips = clips.take(indices)
+        print(f"Sampling {sample} clips for: {', '.join(sorted(SAMPLED_CHECKS))}\n")
+
+    # Load analysis metadata (only if a requested check needs it)
+    metadata = {'duration': 180.0, 'bpm': 120, 'sections': []}
+    beat_times = []
+
+    if checks is None or checks & ANALYSIS_CHECKS:
+        analysis_path = _analysis_path()
+
+        # One read serves both the metadata and the beat times
+        try:
+            analysis = read_json_cached(str(analysis_path))
+        except FileNotFoundError:
+            print("Warning: analysis.json not found, using defaults")
+        else:
+            metadata = extract_analysis_metadata(analysis)
+            beat_times = analysis.get('beats', [])
 
     # Run validation checks
     validation_results = {}
 
-    # 1. Clip ID Uniqueness
-    validation_results['clip_id_uniqueness'] = validate_unique_ids(clips, 'clip_id')
-    print_check("Clip ID Uniqueness", validation_results['clip_id_uniqueness'])
-
-    # 2. Timing Consistency
-    validation_results['timing_consistency'] = validate_timing_consistency(clips)
-    print_check("Timing Consistency", validation_results['timing_consistency'])
-
-    # 3. Section Coverage
-    sections = metadata.get('sections', [])
-    validation_results['section_coverage'] = validate_section_coverage(clips, sections)
-    print_check("Section Coverage", validation_results['section_coverage'])
-
-    # 4. Timeline Coverage
-    total_duration = metadata.get('duration', 180.0)
-    validation_results['timeline_coverage'] = validate_timeline_coverage(clips, total_duration)
-    print_check("Timeline Coverage", validation_results['timeline_coverage'])
-
-    # 5. Beat Alignment
-    validation_results['beat_alignment'] = validate_beat_alignment(clips, beat_times)
-    print_check("Beat Alignment", validation_results['beat_alignment'])
-
-    # 6. Base Allocation
-    validation_results['base_allocation'] = validate_base_allocation(clips)
-    print_check("Base Allocation", validation_results['base_allocation'])
-
-    # 7. Creative Adjustments
-    validation_results['creative_adjustments'] = validate_creative_adjustments(clips)
-    print_check("Creative Adjustments", validation_results['creative_adjustments'])
-
-    # 8. Duration Sanity
-    validation_results['duration_sanity'] = validate_duration_sanity(clips)
-    print_check("Duration Sanity", validation_results['duration_sanity'])
+    for name, display_name, check in CHECKS:
+        if checks is not None and name not in checks:
+            continue
+        check_clips = sampled_clips if name in SAMPLED_CHECKS else clips
+        validation_results[name] = check(check_clips, metadata, beat_times)
+        print_check(display_name, validation_results[name])
 
     # Build summary
     summary = build_validation_summary(validation_results)
@@ -324,10 +443,18 @@ def validate_clip_division(session_id: str) -> Dict[str, Any]:
         "summary": summary
     }
 
+    if sample is not None:
+        report["sampled"] = sampled_clips is not clips
+        report["sample_size"] = len(sampled_clips)
+        report["population_size"] = len(clips)
+
+    if checks is not None or sample is not None:
+        return report
+
     # Save report
     session_dir = get_session_dir(session_id)
     report_path = session_dir / "validation_clip_division.json"
-    write_json(str(report_path), report)
+    _write_report(report_path, report)
 
     print(f"Validation complete. Report saved to:")
     print(f"{report_path}")
@@ -344,11 +471,26 @@ def main():
         "session_id",
         help="Session ID to validate"
     )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        metavar="N",
+        help="Run the per-clip checks on a random sample of N clips (report is not saved)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        metavar="S",
+        help="Random seed for --sample"
+    )
 
     args = parser.parse_args()
 
+    if args.sample is not None and args.sample < 1:
+        parser.error("--sample must be at least 1")
+
     # Run validation
-    report = validate_clip_division(args.session_id)
+    report = validate_clip_division(args.session_id, sample=args.sample, seed=args.seed)
 
     # Exit with appropriate code
     if report['summary']['overall_status'] == "PASS":
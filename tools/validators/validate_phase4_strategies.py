@@ -19,8 +19,10 @@ Usage:
 
 import sys
 import argparse
+import functools
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -31,19 +33,60 @@ from tools.validators.validation_utils import (
     print_header,
     print_check,
     print_summary,
-    extract_clips_from_phase3,
+    iter_clips_from_phase3,
     build_validation_summary,
     parse_cost_range
 )
 
 
 # Valid generation modes
-VALID_GENERATION_MODES = {
+VALID_GENERATION_MODES = frozenset({
     'veo2', 'sora', 'runway_gen3', 'pika', 'traditional', 'hybrid',
     'image_to_video', 'video_to_video'
+})
+
+# Known asset types
+VALID_ASSET_TYPES = frozenset({
+    'character_reference', 'style_guide', 'reference_image',
+    'source_video', 'audio_segment', 'location_reference',
+    'prop_reference', 'lighting_reference'
+})
+
+# Fields every consistency_requirements dict must have, and their levels
+REQUIRED_CONSISTENCY_FIELDS = frozenset({
+    'character_consistency', 'background_consistency', 'style_consistency'
+})
+VALID_CONSISTENCY_VALUES = frozenset({'low', 'medium', 'high'})
+
+# Separators folded to '_' when normalizing a generation mode name
+_MODE_SEPARATORS = str.maketrans({' ': '_', '-': '_'})
+
+# Spellings that only match a valid mode once their separators are dropped,
+# e.g. 'Runway Gen-3' -> 'runway_gen_3' -> 'runway_gen3'
+_MODE_ALIASES = {
+    'runway_gen_3': 'runway_gen3',
+    'veo_2': 'veo2',
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _normalize_mode(mode: str) -> str:
+    """
+    Normalize a generation mode name, e.g. 'Runway Gen-3' -> 'runway_gen3'.
+
+    Cached, since a session only uses a handful of distinct spellings.
+
+    Args:
+        mode: Generation mode as written in the strategy
+
+    Returns:
+        Lowercase mode name with spaces and dashes replaced by underscores,
+        mapped through _MODE_ALIASES
+    """
+    mode = mode.lower().translate(_MODE_SEPARATORS)
+    return _MODE_ALIASES.get(mode, mode)
+
+
 def validate_strategy_completeness(
     phase3_clips: List[Dict[str, Any]],
     phase4_strategies: List[Dict[str, Any]]
@@ -58,11 +101,16 @@ def validate_strategy_completeness(
     Returns:
         Validation result dictionary
     """
-    phase3_clip_ids = set(clip.get('clip_id') for clip in phase3_clips)
-    phase4_clip_ids = set(strategy.get('clip_id') for strategy in phase4_strategies)
+    phase3_clip_ids = {clip.get('clip_id') for clip in phase3_clips}
+    phase4_clip_ids = {strategy.get('clip_id') for strategy in phase4_strategies}
 
-    missing_clips = phase3_clip_ids - phase4_clip_ids
-    extra_clips = phase4_clip_ids - phase3_clip_ids
+    # Only take the differences if the ID sets disagree (the common case
+    # is a one-to-one match)
+    if phase3_clip_ids == phase4_clip_ids:
+        missing_clips = extra_clips = set()
+    else:
+        missing_clips = phase3_clip_ids - phase4_clip_ids
+        extra_clips = phase4_clip_ids - phase3_clip_ids
 
     passed = len(missing_clips) == 0 and len(extra_clips) == 0
 
@@ -79,8 +127,8 @@ def validate_strategy_completeness(
         "passed": passed,
         "total_clips_phase3": len(phase3_clip_ids),
         "total_strategies_phase4": len(phase4_clip_ids),
-        "missing_clips": list(missing_clips)[:5],  # Limit to first 5
-        "extra_clips": list(extra_clips)[:5],
+        "missing_clips": sorted(missing_clips, key=str)[:5],  # Limit to first 5
+        "extra_clips": sorted(extra_clips, key=str)[:5],
         "message": message
     }
 
@@ -95,25 +143,22 @@ def validate_generation_mode_validity(strategies: List[Dict[str, Any]]) -> Dict[
     Returns:
         Validation result dictionary
     """
-    invalid_modes = []
-    mode_distribution = {}
+    modes = [_normalize_mode(strategy.get('generation_mode', '')) for strategy in strategies]
 
-    for strategy in strategies:
-        clip_id = strategy.get('clip_id', 'unknown')
-        mode = strategy.get('generation_mode', '').lower()
-
-        # Normalize mode name
-        mode = mode.replace(' ', '_').replace('-', '_')
+    # Count distribution
+    mode_distribution = dict(Counter(modes))
 
-        # Count distribution
-        mode_distribution[mode] = mode_distribution.get(mode, 0) + 1
-
-        # Check validity
-        if mode not in VALID_GENERATION_MODES:
-            invalid_modes.append({
-                'clip_id': clip_id,
+    # Check validity (only walk the strategies if some mode is unknown)
+    invalid_modes = []
+    if not VALID_GENERATION_MODES.issuperset(mode_distribution):
+        invalid_modes = [
+            {
+                'clip_id': strategy.get('clip_id', 'unknown'),
                 'mode': strategy.get('generation_mode', '')
-            })
+            }
+            for strategy, mode in zip(strategies, modes)
+            if mode not in VALID_GENERATION_MODES
+        ]
 
     passed = len(invalid_modes) == 0
 
@@ -138,7 +183,7 @@ def validate_prompt_quality(strategies: List[Dict[str, Any]]) -> Dict[str, Any]:
     empty_prompts = []
     too_short = []
     too_long = []
-    prompt_lengths = []
+    total_length = 0
 
     MIN_PROMPT_LENGTH = 20
     MAX_PROMPT_LENGTH = 1000
@@ -154,16 +199,16 @@ def validate_prompt_quality(strategies: List[Dict[str, Any]]) -> Dict[str, Any]:
             prompt_text = str(prompt_template)
 
         prompt_length = len(prompt_text.strip())
-        prompt_lengths.append(prompt_length)
+        total_length += prompt_length
 
-        if not prompt_text.strip():
+        if not prompt_length:
             empty_prompts.append(clip_id)
         elif prompt_length < MIN_PROMPT_LENGTH:
             too_short.append(clip_id)
         elif prompt_length > MAX_PROMPT_LENGTH:
             too_long.append(clip_id)
 
-    avg_length = sum(prompt_lengths) / len(prompt_lengths) if prompt_lengths else 0
+    avg_length = total_length / len(strategies) if strategies else 0
 
     passed = len(empty_prompts) == 0 and len(too_short) == 0
 
@@ -198,12 +243,6 @@ def validate_asset_requirements(strategies: List[Dict[str, Any]]) -> Dict[str, A
     Returns:
         Validation result dictionary
     """
-    VALID_ASSET_TYPES = {
-        'character_reference', 'style_guide', 'reference_image',
-        'source_video', 'audio_segment', 'location_reference',
-        'prop_reference', 'lighting_reference'
-    }
-
     missing_assets = []
     asset_types_used = set()
 
@@ -242,12 +281,6 @@ def validate_consistency_requirements(strategies: List[Dict[str, Any]]) -> Dict[
     Returns:
         Validation result dictionary
     """
-    REQUIRED_CONSISTENCY_FIELDS = {
-        'character_consistency', 'background_consistency', 'style_consistency'
-    }
-
-    VALID_CONSISTENCY_VALUES = {'low', 'medium', 'high'}
-
     missing_consistency = []
 
     for strategy in strategies:
@@ -259,8 +292,7 @@ def validate_consistency_requirements(strategies: List[Dict[str, Any]]) -> Dict[
             continue
 
         # Check for required fields
-        missing_fields = REQUIRED_CONSISTENCY_FIELDS - set(consistency_reqs.keys())
-        if missing_fields:
+        if not REQUIRED_CONSISTENCY_FIELDS.issubset(consistency_reqs):
             missing_consistency.append(clip_id)
 
     passed = len(missing_consistency) == 0
@@ -348,6 +380,25 @@ def validate_creative_adjustments(strategies: List[Dict[str, Any]]) -> Dict[str,
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _estimate_hours(time_estimate: str) -> int:
+    """
+    Roughly convert a time estimate like "2-3 days" to hours.
+
+    Args:
+        time_estimate: Time estimate string
+
+    Returns:
+        168 for weeks, 24 for days, otherwise 1
+    """
+    time_estimate = time_estimate.lower()
+    if 'week' in time_estimate:
+        return 168  # 1 week
+    if 'day' in time_estimate:
+        return 24
+    return 1
+
+
 def validate_budget_timeline(strategies: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Validate budget and timeline estimates.
@@ -370,14 +421,7 @@ def validate_budget_timeline(strategies: List[Dict[str, Any]]) -> Dict[str, Any]
         total_max_cost += max_cost
 
         # Parse time estimate (rough)
-        time_estimate = strategy.get('estimated_time', '1 day')
-        if 'week' in time_estimate.lower():
-            hours = 168  # 1 week
-        elif 'day' in time_estimate.lower():
-            hours = 24
-        else:
-            hours = 1
-        total_time_hours += hours
+        total_time_hours += _estimate_hours(strategy.get('estimated_time', '1 day'))
 
     passed = True  # Budget/timeline always pass if present
 
@@ -389,16 +433,53 @@ def validate_budget_timeline(strategies: List[Dict[str, Any]]) -> Dict[str, Any]
     }
 
 
-def validate_phase4_strategies(session_id: str) -> Dict[str, Any]:
+# Checks in run order: (result key, display name, check function).
+# Check functions take (phase3_clips, strategies).
+CHECKS = [
+    ('strategy_completeness', "Strategy Completeness",
+     lambda phase3_clips, strategies: validate_strategy_completeness(phase3_clips, strategies)),
+    ('generation_mode_validity', "Generation Mode Validity",
+     lambda phase3_clips, strategies: validate_generation_mode_validity(strategies)),
+    ('prompt_quality', "Prompt Quality",
+     lambda phase3_clips, strategies: validate_prompt_quality(strategies)),
+    ('asset_requirements', "Asset Requirements",
+     lambda phase3_clips, strategies: validate_asset_requirements(strategies)),
+    ('consistency_requirements', "Consistency Requirements",
+     lambda phase3_clips, strategies: validate_consistency_requirements(strategies)),
+    ('variance_parameters', "Variance Parameters",
+     lambda phase3_clips, strategies: validate_variance_parameters(strategies)),
+    ('creative_adjustments', "Creative Adjustments",
+     lambda phase3_clips, strategies: validate_creative_adjustments(strategies)),
+    ('budget_timeline', "Budget/Timeline Estimates",
+     lambda phase3_clips, strategies: validate_budget_timeline(strategies)),
+]
+
+
+def validate_phase4_strategies(
+    session_id: str,
+    checks: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
     """
     Main validation function for Phase 4 generation strategies.
 
     Args:
         session_id: Session identifier
+        checks: Names of the checks to run (see CHECKS). Runs all checks and
+            saves the report to the session directory if None; a partial
+            run is not saved.
 
     Returns:
         Complete validation results dictionary
+
+    Raises:
+        ValueError: If an unknown check name is requested
     """
+    if checks is not None:
+        checks = set(checks)
+        unknown = checks.difference(name for name, _, _ in CHECKS)
+        if unknown:
+            raise ValueError(f"Unknown Phase 4 checks: {sorted(unknown)}")
+
     # Print header
     print_header("=== MV Orchestra v2.8 - Phase 4 Generation Strategies Validation ===", session_id)
 
@@ -417,7 +498,8 @@ def validate_phase4_strategies(session_id: str) -> Dict[str, Any]:
         print(f"Warning: Phase 4 status is '{phase4_data.status}', not 'completed'")
 
     # Extract data
-    phase3_clips = extract_clips_from_phase3(phase3_data.data)
+    # Only clip IDs are read from Phase 3, so skip copying the clips
+    phase3_clips = [clip for clip, _ in iter_clips_from_phase3(phase3_data.data)]
 
     # Extract Phase 4 strategies
     winner = phase4_data.data.get('winner', {})
@@ -433,39 +515,11 @@ def validate_phase4_strategies(session_id: str) -> Dict[str, Any]:
     # Run validation checks
     validation_results = {}
 
-    # 1. Strategy Completeness
-    validation_results['strategy_completeness'] = validate_strategy_completeness(
-        phase3_clips, strategies
-    )
-    print_check("Strategy Completeness", validation_results['strategy_completeness'])
-
-    # 2. Generation Mode Validity
-    validation_results['generation_mode_validity'] = validate_generation_mode_validity(strategies)
-    print_check("Generation Mode Validity", validation_results['generation_mode_validity'])
-
-    # 3. Prompt Quality
-    validation_results['prompt_quality'] = validate_prompt_quality(strategies)
-    print_check("Prompt Quality", validation_results['prompt_quality'])
-
-    # 4. Asset Requirements
-    validation_results['asset_requirements'] = validate_asset_requirements(strategies)
-    print_check("Asset Requirements", validation_results['asset_requirements'])
-
-    # 5. Consistency Requirements
-    validation_results['consistency_requirements'] = validate_consistency_requirements(strategies)
-    print_check("Consistency Requirements", validation_results['consistency_requirements'])
-
-    # 6. Variance Parameters
-    validation_results['variance_parameters'] = validate_variance_parameters(strategies)
-    print_check("Variance Parameters", validation_results['variance_parameters'])
-
-    # 7. Creative Adjustments
-    validation_results['creative_adjustments'] = validate_creative_adjustments(strategies)
-    print_check("Creative Adjustments", validation_results['creative_adjustments'])
-
-    # 8. Budget/Timeline
-    validation_results['budget_timeline'] = validate_budget_timeline(strategies)
-    print_check("Budget/Timeline Estimates", validation_results['budget_timeline'])
+    for name, display_name, check in CHECKS:
+        if checks is not None and name not in checks:
+            continue
+        validation_results[name] = check(phase3_clips, strategies)
+        print_check(display_name, validation_results[name])
 
     # Build summary
     summary = build_validation_summary(validation_results)
@@ -483,6 +537,9 @@ def validate_phase4_strategies(session_id: str) -> Dict[str, Any]:
         "summary": summary
     }
 
+    if checks is not None:
+        return report
+
     # Save report
     session_dir = get_session_dir(session_id)
     report_path = session_dir / "validation_phase4_strategies.json"
@@ -8,10 +8,128 @@ This module provides common utilities used across different validators including
 - Common validation checks
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import functools
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
 
+@dataclass
+class ClipTable:
+    """
+    Column-oriented view of a clip list.
+
+    Built once per clip list and shared by the clip checks, so each clip
+    dictionary is read once instead of once per check. Missing fields take
+    the defaults the checks have always used.
+
+    Attributes:
+        ids: clip_id per clip (None if missing)
+        has_id: Whether each clip has a clip_id key (which may be None)
+        starts: start_time per clip
+        ends: end_time per clip
+        durations: duration per clip
+        sections: section name per clip
+        beat_aligned: beat_aligned flag per clip
+        has_base_allocation: Whether each clip has base_allocation
+        has_creative_adjustments: Whether each clip has creative_adjustments
+    """
+    ids: List[Optional[str]]
+    has_id: List[bool]
+    starts: List[float]
+    ends: List[float]
+    durations: List[float]
+    sections: List[str]
+    beat_aligned: List[bool]
+    has_base_allocation: List[bool]
+    has_creative_adjustments: List[bool]
+
+    @classmethod
+    def from_clips(cls, clips: List[Dict[str, Any]]) -> 'ClipTable':
+        """
+        Build a ClipTable from clip dictionaries.
+
+        Args:
+            clips: List of clip dictionaries
+
+        Returns:
+            ClipTable with one entry per clip
+        """
+        return cls(
+            ids=[clip.get('clip_id') for clip in clips],
+            has_id=['clip_id' in clip for clip in clips],
+            starts=[clip.get('start_time', 0) for clip in clips],
+            ends=[clip.get('end_time', 0) for clip in clips],
+            durations=[clip.get('duration', 0) for clip in clips],
+            sections=[clip.get('section', '') for clip in clips],
+            beat_aligned=[clip.get('beat_aligned', False) for clip in clips],
+            has_base_allocation=['base_allocation' in clip for clip in clips],
+            has_creative_adjustments=['creative_adjustments' in clip for clip in clips]
+        )
+
+    @classmethod
+    def from_phase3(cls, phase3_data: Dict[str, Any]) -> 'ClipTable':
+        """
+        Build a ClipTable straight from Phase 3 data.
+
+        Equivalent to from_clips(extract_clips_from_phase3(phase3_data)), but
+        reads the clips in place instead of copying each one to attach its
+        section name.
+
+        Args:
+            phase3_data: Phase 3 data from SharedState
+
+        Returns:
+            ClipTable with one entry per clip
+        """
+        pairs = list(iter_clips_from_phase3(phase3_data))
+        table = cls.from_clips([clip for clip, _ in pairs])
+        table.sections = [
+            clip.get('section', '') if section is None else section
+            for clip, section in pairs
+        ]
+        return table
+
+    def take(self, indices: Iterable[int]) -> 'ClipTable':
+        """
+        Get a new ClipTable with only the clips at the given indices.
+
+        Args:
+            indices: Clip indices, in the order to keep them
+
+        Returns:
+            ClipTable with one entry per index
+        """
+        indices = list(indices)
+        return ClipTable(**{
+            field.name: [getattr(self, field.name)[i] for i in indices]
+            for field in fields(self)
+        })
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def clip_id(self, index: int) -> str:
+        """Get a clip's ID for messages ('unknown' if missing)."""
+        clip_id = self.ids[index]
+        return 'unknown' if clip_id is None else clip_id
+
+
+def as_clip_table(clips: Union[List[Dict[str, Any]], ClipTable]) -> ClipTable:
+    """
+    Get a ClipTable for clips, building one from a list if needed.
+
+    Args:
+        clips: List of clip dictionaries or an existing ClipTable
+
+    Returns:
+        ClipTable for the clips
+    """
+    if isinstance(clips, ClipTable):
+        return clips
+    return ClipTable.from_clips(clips)
+
+
 def print_header(title: str, session_id: str) -> None:
     """
     Print a formatted header for validation output.
@@ -20,11 +138,14 @@ def print_header(title: str, session_id: str) -> None:
         title: Title of the validation
         session_id: Session identifier
     """
-    print(f"\n{'='*70}")
-    print(f"{title}")
-    print(f"{'='*70}")
-    print(f"Session: {session_id}")
-    print()
+    lines = [
+        f"\n{'='*70}",
+        f"{title}",
+        f"{'='*70}",
+        f"Session: {session_id}",
+        "",
+    ]
+    print("\n".join(lines))
 
 
 def print_check(name: str, result: Dict[str, Any], indent: int = 0) -> None:
@@ -47,13 +168,17 @@ def print_check(name: str, result: Dict[str, Any], indent: int = 0) -> None:
     elif "alignment_percentage" in result:
         extra_info = f" ({result['alignment_percentage']:.1f}%)"
 
-    print(f"{indent_str}[{status}] {name}: {status_text}{extra_info}")
-    print(f"{indent_str}    {result['message']}")
+    lines = [
+        f"{indent_str}[{status}] {name}: {status_text}{extra_info}",
+        f"{indent_str}    {result['message']}",
+    ]
 
     # Print warnings if any
     if "warnings" in result and result["warnings"]:
         for warning in result["warnings"]:
-            print(f"{indent_str}    ! {warning}")
+            lines.append(f"{indent_str}    ! {warning}")
+
+    print("\n".join(lines))
 
 
 def print_summary(summary: Dict[str, Any]) -> None:
@@ -63,36 +188,54 @@ def print_summary(summary: Dict[str, Any]) -> None:
     Args:
         summary: Summary dictionary with counts and status
     """
-    print(f"\n{'='*70}")
-    print("Summary")
-    print(f"{'='*70}")
-    print(f"Overall Status: {summary['overall_status']}")
-    print(f"Passed: {summary['passed_checks']}/{summary['total_checks']} checks")
+    lines = [
+        f"\n{'='*70}",
+        "Summary",
+        f"{'='*70}",
+        f"Overall Status: {summary['overall_status']}",
+        f"Passed: {summary['passed_checks']}/{summary['total_checks']} checks",
+    ]
     if summary.get('warnings', 0) > 0:
-        print(f"Warnings: {summary['warnings']}")
-    print()
+        lines.append(f"Warnings: {summary['warnings']}")
+    lines.append("")
+    print("\n".join(lines))
 
 
-def validate_unique_ids(items: List[Dict[str, Any]], id_key: str = "clip_id") -> Dict[str, Any]:
+def validate_unique_ids(
+    items: Union[List[Dict[str, Any]], ClipTable],
+    id_key: str = "clip_id"
+) -> Dict[str, Any]:
     """
     Validate that all IDs are unique in a list of items.
 
     Args:
-        items: List of items to check
-        id_key: Key name for the ID field
+        items: List of items to check, or a ClipTable (uses its clip IDs)
+        id_key: Key name for the ID field (must be "clip_id" for a ClipTable)
 
     Returns:
         Validation result dictionary
+
+    Raises:
+        ValueError: If items is a ClipTable and id_key is not "clip_id"
     """
-    ids = [item.get(id_key) for item in items if id_key in item]
+    if isinstance(items, ClipTable):
+        if id_key != "clip_id":
+            raise ValueError(f"A ClipTable only holds clip IDs, not '{id_key}'")
+        # Same items as the list path: every clip with the key, even if None
+        ids = [item_id for item_id, has_id in zip(items.ids, items.has_id) if has_id]
+    else:
+        ids = [item.get(id_key) for item in items if id_key in item]
     duplicate_ids = []
-    seen = set()
+    seen = set(ids)
 
-    for item_id in ids:
-        if item_id in seen:
-            duplicate_ids.append(item_id)
-        else:
-            seen.add(item_id)
+    # Only scan for the duplicates themselves if there are any
+    if len(seen) != len(ids):
+        seen = set()
+        for item_id in ids:
+            if item_id in seen:
+                duplicate_ids.append(item_id)
+            else:
+                seen.add(item_id)
 
     passed = len(duplicate_ids) == 0
 
@@ -103,24 +246,29 @@ def validate_unique_ids(items: List[Dict[str, Any]], id_key: str = "clip_id") ->
     }
 
 
-def validate_timing_consistency(clips: List[Dict[str, Any]], tolerance: float = 0.01) -> Dict[str, Any]:
+def validate_timing_consistency(
+    clips: Union[List[Dict[str, Any]], ClipTable],
+    tolerance: float = 0.01
+) -> Dict[str, Any]:
     """
     Validate timing consistency for clips.
 
     Args:
-        clips: List of clip dictionaries
+        clips: List of clip dictionaries or a ClipTable
         tolerance: Tolerance for float comparisons (seconds)
 
     Returns:
         Validation result dictionary
     """
+    table = as_clip_table(clips)
     issues = []
 
-    for clip in clips:
-        clip_id = clip.get('clip_id', 'unknown')
-        start = clip.get('start_time', 0)
-        end = clip.get('end_time', 0)
-        duration = clip.get('duration', 0)
+    for i, (start, end, duration) in enumerate(zip(table.starts, table.ends, table.durations)):
+        # Fast path: ordered, non-negative and consistent (the common case)
+        if 0 <= start < end and duration >= 0 and abs(duration - (end - start)) <= tolerance:
+            continue
+
+        clip_id = table.clip_id(i)
 
         # Check start < end
         if start >= end:
@@ -148,7 +296,7 @@ def validate_timing_consistency(clips: List[Dict[str, Any]], tolerance: float =
 
 
 def validate_timeline_coverage(
-    clips: List[Dict[str, Any]],
+    clips: Union[List[Dict[str, Any]], ClipTable],
     total_duration: float,
     gap_tolerance: float = 0.5
 ) -> Dict[str, Any]:
@@ -156,24 +304,31 @@ def validate_timeline_coverage(
     Validate that clips cover the full timeline without gaps or overlaps.
 
     Args:
-        clips: List of clip dictionaries
+        clips: List of clip dictionaries or a ClipTable
         total_duration: Total duration that should be covered
         gap_tolerance: Maximum allowed gap size (seconds)
 
     Returns:
         Validation result dictionary
     """
-    # Sort clips by start time
-    sorted_clips = sorted(clips, key=lambda c: c.get('start_time', 0))
+    table = as_clip_table(clips)
+    starts = table.starts
+    ends = table.ends
+
+    # Clip indices sorted by start time. Phase 3 usually emits clips in
+    # order, and a plain float sort is much cheaper than a keyed one.
+    if starts == sorted(starts):
+        order = range(len(table))
+    else:
+        order = sorted(range(len(table)), key=starts.__getitem__)
 
     gaps = []
     overlaps = []
     current_time = 0.0
 
-    for clip in sorted_clips:
-        start = clip.get('start_time', 0)
-        end = clip.get('end_time', 0)
-        clip_id = clip.get('clip_id', 'unknown')
+    for i in order:
+        start = starts[i]
+        end = ends[i]
 
         # Check for gap
         gap_size = start - current_time
@@ -187,13 +342,14 @@ def validate_timeline_coverage(
         # Check for overlap
         if start < current_time - 0.01:  # Small tolerance for rounding
             overlaps.append({
-                'clip_id': clip_id,
+                'clip_id': table.clip_id(i),
                 'overlap_start': start,
                 'overlap_end': min(end, current_time),
                 'size': current_time - start
             })
 
-        current_time = max(current_time, end)
+        if end > current_time:
+            current_time = end
 
     # Check final coverage
     final_gap = total_duration - current_time
@@ -228,7 +384,7 @@ def validate_timeline_coverage(
 
 
 def validate_duration_sanity(
-    clips: List[Dict[str, Any]],
+    clips: Union[List[Dict[str, Any]], ClipTable],
     min_duration: float = 0.5,
     max_duration: float = 30.0
 ) -> Dict[str, Any]:
@@ -236,20 +392,22 @@ def validate_duration_sanity(
     Validate that clip durations are within reasonable bounds.
 
     Args:
-        clips: List of clip dictionaries
+        clips: List of clip dictionaries or a ClipTable
         min_duration: Minimum reasonable duration (seconds)
         max_duration: Maximum reasonable duration (seconds)
 
     Returns:
         Validation result dictionary
     """
+    table = as_clip_table(clips)
+    durations = table.durations
     warnings = []
-    durations = []
 
-    for clip in clips:
-        clip_id = clip.get('clip_id', 'unknown')
-        duration = clip.get('duration', 0)
-        durations.append(duration)
+    for i, duration in enumerate(durations):
+        if min_duration <= duration <= max_duration:
+            continue
+
+        clip_id = table.clip_id(i)
 
         if duration < min_duration:
             warnings.append(f"{clip_id}: duration too short ({duration}s < {min_duration}s)")
@@ -277,10 +435,14 @@ def validate_duration_sanity(
     }
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_cost_range(cost_str: str) -> Tuple[float, float]:
     """
     Parse a cost range string like "$50-150" or "$100+".
 
+    Cached, since strategies built from the same mode templates repeat the
+    same few cost strings.
+
     Args:
         cost_str: Cost string to parse
 
@@ -319,7 +481,7 @@ def load_analysis_metadata(analysis_path: Path) -> Dict[str, Any]:
     Returns:
         Dictionary with duration, bpm, sections, etc.
     """
-    from core.utils import read_json
+    from core.utils import read_json_cached
 
     if not analysis_path.exists():
         return {
@@ -328,8 +490,19 @@ def load_analysis_metadata(analysis_path: Path) -> Dict[str, Any]:
             'sections': []
         }
 
-    analysis = read_json(str(analysis_path))
+    return extract_analysis_metadata(read_json_cached(str(analysis_path)))
+
 
+def extract_analysis_metadata(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract metadata from parsed analysis.json data.
+
+    Args:
+        analysis: Parsed analysis.json data
+
+    Returns:
+        Dictionary with duration, bpm, sections, etc.
+    """
     return {
         'duration': analysis.get('duration', 180.0),
         'bpm': analysis.get('bpm', 120),
@@ -338,18 +511,57 @@ def load_analysis_metadata(analysis_path: Path) -> Dict[str, Any]:
     }
 
 
-def extract_clips_from_phase3(phase3_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_file_cache_key(file_path: Path) -> Optional[Tuple[int, int]]:
     """
-    Extract flat list of clips from Phase 3 data structure.
+    Get a cache key for the current contents of a file.
+
+    Keyed on size as well as modification time (like core.utils.read_json_cached),
+    so a rewrite within the same timestamp tick is still detected when the
+    size changes.
 
     Args:
-        phase3_data: Phase 3 data from SharedState
+        file_path: Path to the file
 
     Returns:
-        List of clip dictionaries
+        Tuple of (modification time in nanoseconds, size in bytes), or None
+        if the file doesn't exist
+    """
+    try:
+        stat = Path(file_path).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_session_cache_key(session_id: str) -> Optional[Tuple[int, int]]:
+    """
+    Get a cache key for the current contents of a session's state.json.
+
+    Any saved change to the session changes it (see get_file_cache_key).
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        Tuple of (modification time in nanoseconds, size in bytes), or None
+        if the session doesn't exist
+    """
+    from core.utils import get_session_dir
+
+    return get_file_cache_key(get_session_dir(session_id) / "state.json")
+
+
+def iter_clips_from_phase3(phase3_data: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], Optional[str]]]:
     """
-    clips = []
+    Iterate over the clips in a Phase 3 data structure without copying them.
+
+    Args:
+        phase3_data: Phase 3 data from SharedState
 
+    Yields:
+        Tuples of (clip dictionary, section name). The section name is None
+        for clips listed directly in the proposal, which carry their own.
+    """
     # Get winner's proposal
     winner = phase3_data.get('winner', {})
     proposal = winner.get('proposal', {})
@@ -358,17 +570,31 @@ def extract_clips_from_phase3(phase3_data: Dict[str, Any]) -> List[Dict[str, Any
     if 'sections' in proposal:
         for section in proposal['sections']:
             if 'clips' in section:
+                section_name = section.get('section_name', '')
                 for clip in section['clips']:
-                    # Add section context to clip
-                    enhanced_clip = clip.copy()
-                    enhanced_clip['section'] = section.get('section_name', '')
-                    clips.append(enhanced_clip)
+                    yield clip, section_name
 
     # Check if clips are directly in proposal
     elif 'clips' in proposal:
-        clips = proposal['clips']
+        for clip in proposal['clips']:
+            yield clip, None
+
 
-    return clips
+def extract_clips_from_phase3(phase3_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extract flat list of clips from Phase 3 data structure.
+
+    Args:
+        phase3_data: Phase 3 data from SharedState
+
+    Returns:
+        List of clip dictionaries
+    """
+    # Add section context to clips listed under a section
+    return [
+        clip if section_name is None else dict(clip, section=section_name)
+        for clip, section_name in iter_clips_from_phase3(phase3_data)
+    ]
 
 
 def build_validation_summary(validation_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]: